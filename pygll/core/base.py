@@ -27,6 +27,25 @@ class ParsingError(Exception):
 
 class AbstractParser(abc.ABC):
 
+    # Parser state is accessed in every parsing function,
+    # so attributes are stored in slots rather than a dict.
+    __slots__ = (
+        'logger',
+        'debug',
+        'scanner',
+        'todo',
+        'seen_descriptors',
+        'popped',
+        'created',
+        'terminal_nodes',
+        'gss',
+        'root',
+        'c_u',
+        'c_n',
+        'c_r',
+        'current_state',
+    )
+
     NULL_SLOT = GrammarSlot('$null', 0, 0, False, False)
 
     def __init__(self,
@@ -20,15 +20,27 @@ def build_dynamic_parser(
 
 class _InterpretedParser(_base.AbstractParser):
 
+    __slots__ = ('__def', '__slots', '__goto', '__checks_by_slot')
+
     def __init__(self,
                  definition: _ast.ParserDefinition,
                  **kwargs):
         self.__def = definition
+        # Grammar slots are created once, up front, instead of
+        # every time an instruction refers to them.
+        self.__slots = {
+            name: self.__definition_to_slot(slot)
+            for name, slot in definition.grammar_slots.items()
+        }
+        self.__goto = {
+            self.__slots[name] if name is not None else None: function_name
+            for name, function_name in definition.goto.items()
+        }
         self.__checks_by_slot = {}
         for name, check in definition.ambiguity_checks.items():
             if not check.as_pop_check():
                 continue
-            slot = self.__definition_to_slot(self.__def.grammar_slots[check.slot])
+            slot = self.__slots[check.slot]
             self.__checks_by_slot.setdefault(slot, []).append(
                 lambda *args, _c=name: self.__emulate_pop_check(*args, _c)
             )
@@ -36,12 +48,7 @@ class _InterpretedParser(_base.AbstractParser):
         super().__init__(**kwargs)
 
     def goto(self, slot: GrammarSlot | None):
-        if slot is None:
-            function_name = self.__def.goto[None]
-        else:
-            name = self.__slot_to_name(slot)
-            function_name = self.__def.goto[name]
-        self.goto_name(function_name)
+        self.goto_name(self.__goto[slot])
 
     def goto_name(self, name: str):
         function = self.__def.parse_functions[name]
@@ -72,24 +79,21 @@ class _InterpretedParser(_base.AbstractParser):
                         self.scanner.advance(len(check.text))
                     else:
                         if target == _ast.NodeAssignmentTarget.CN:
-                            self.c_n = self.get_node_t(self.scanner.peek())
+                            self.c_n = self.get_node_t(self.scanner.peek(1))
                         else:
-                            self.c_r = self.get_node_t(self.scanner.peek())
+                            self.c_r = self.get_node_t(self.scanner.peek(1))
                         self.scanner.advance(1)
                 case _ast.InvokeNodeP(target=target, grammar_slot=slot_name):
-                    slot_definition = self.__def.grammar_slots[slot_name]
-                    slot = self.__definition_to_slot(slot_definition)
+                    slot = self.__slots[slot_name]
                     if target == _ast.NodeAssignmentTarget.CN:
                         self.c_n = self.get_node_p(slot, self.c_n, self.c_r)
                     else:
                         assert False
                 case _ast.InvokeCreate(grammar_slot=slot_name):
-                    slot_definition = self.__def.grammar_slots[slot_name]
-                    slot = self.__definition_to_slot(slot_definition)
+                    slot = self.__slots[slot_name]
                     self.c_u = self.create(slot)
                 case _ast.InvokeAdd(grammar_slot=slot_name):
-                    slot_definition = self.__def.grammar_slots[slot_name]
-                    slot = self.__definition_to_slot(slot_definition)
+                    slot = self.__slots[slot_name]
                     self.add(slot, self.c_u, self.scanner.position, _nodes.InitialNode(0, 0))
                 case _ast.CallFunction(function=function_name):
                     self.goto_name(function_name)
@@ -108,7 +112,7 @@ class _InterpretedParser(_base.AbstractParser):
             case _ast.LiteralCheckDefinition(text=text):
                 return self.scanner.has_next(text)
             case _ast.RangeCheckDefinition(ranges=ranges):
-                char = self.scanner.peek(1)
+                char = self.scanner.peek_code_point()
                 for start, stop in ranges:
                     if start <= char <= stop:
                         return True
@@ -170,7 +174,8 @@ class _InterpretedParser(_base.AbstractParser):
                                          literals,
                                          negated,
                                          peek_function) -> bool:
-        char = peek_function(1)
+        text = peek_function(1)
+        char = ord(text) if text else -1
         for start, stop in ranges:
             if start <= char <= stop:
                 return not negated
@@ -201,11 +206,3 @@ class _InterpretedParser(_base.AbstractParser):
             alpha_is_special=definition.alpha,
             beta_is_special=definition.beta
         )
-
-    @staticmethod
-    def __slot_to_name(slot: _nodes.GrammarSlot) -> str:
-        return _ast.GrammarSlotDefinition.get_slot_name(
-            slot.nonterminal,
-            slot.alternate,
-            slot.position,
-        )
@@ -115,6 +115,16 @@ class GrammarSlot:
     position: int
     alpha_is_special: bool
     beta_is_special: bool
+    # Slots are hashed for every descriptor, GSS node and SPPF
+    # node lookup, so the hash is computed once.
+    _hash: int = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.alternate < 0:
+            value = hash(self.nonterminal)
+        else:
+            value = hash((self.nonterminal, self.alternate, self.position))
+        object.__setattr__(self, '_hash', value)
 
     @classmethod
     def full_nonterminal(cls, nonterminal: str, alpha: bool, beta: bool):
@@ -127,8 +137,14 @@ class GrammarSlot:
         )
 
     def __eq__(self, other):
+        # Slots are normally shared, so most comparisons are
+        # comparisons of a slot with itself.
+        if self is other:
+            return True
         if not isinstance(other, GrammarSlot):
             return False
+        if self._hash != other._hash:
+            return False
         if (self.alternate < 0) != (other.alternate < 0):
             return False
         if self.alternate < 0:
@@ -140,9 +156,7 @@ class GrammarSlot:
         )
 
     def __hash__(self):
-        if self.alternate < 0:
-            return hash(self.nonterminal)
-        return hash((self.nonterminal, self.alternate, self.position))
+        return self._hash
 
     def __str__(self):
         if self.alternate < 0:
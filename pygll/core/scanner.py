@@ -1,5 +1,6 @@
 import collections
 import enum
+import re
 
 
 class ScannerEvent(enum.Enum):
@@ -22,13 +23,21 @@ class Scanner:
         self.__pos = value
 
     def has_next(self, pattern: str) -> bool:
-        stop = self.__pos + len(pattern)
-        result = self.__source.find(pattern, self.__pos, stop) != -1
-        return result
+        return self.__source.startswith(pattern, self.__pos)
 
     def peek(self, length: int) -> str:
         return self.__source[self.__pos:self.__pos + length]
 
+    def matches(self, pattern: re.Pattern) -> bool:
+        return pattern.match(self.__source, self.__pos) is not None
+
+    def peek_code_point(self) -> int:
+        # Code point of the next character, or -1 at the end
+        # of the input. Avoids creating a slice for range checks.
+        if self.__pos < len(self.__source):
+            return ord(self.__source[self.__pos])
+        return -1
+
     def peek_forward(self, length: int) -> str:
         return self.__source[self.__pos + 1:self.__pos + length + 1]
         #return self.peek(length)
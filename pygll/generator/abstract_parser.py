@@ -83,6 +83,31 @@ class ParserDefinition:
         init=False, default_factory=dict
     )
 
+    # Names of grammar slots, by (nonterminal, alternate, position)
+    _slot_names: dict[tuple[str, int, int], str] = dataclasses.field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+
+    # Names of the input checks for grammar terminals
+    _terminal_checks: dict[_cfg.Terminal, str] = dataclasses.field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+
+    # Names of the input checks for test sets
+    _test_set_checks: dict[frozenset[_cfg.Terminal], tuple[str, ...]] = dataclasses.field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+
+    # Name of the input check for epsilon
+    _epsilon_check: str | None = dataclasses.field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    # Statements are immutable, so equal ones are shared between functions
+    _node_statements: dict[tuple, StatementDefinition] = dataclasses.field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+
     ###################################################################
     # get_and_declare functions
 
@@ -91,9 +116,7 @@ class ParserDefinition:
                                      alternate: int,
                                      position: int,
                                      grammar: _cfg.ContextFreeGrammar):
-        name = GrammarSlotDefinition.get_slot_name(nonterminal,
-                                                   alternate,
-                                                   position)
+        name = self.get_grammar_slot_name(nonterminal, alternate, position)
         if name not in self.grammar_slots:
             definition = GrammarSlotDefinition.from_key_and_grammar(
                 nonterminal,
@@ -104,18 +127,61 @@ class ParserDefinition:
             self.add_grammar_slot(definition)
         return name
 
+    def get_grammar_slot_name(self,
+                              nonterminal: str,
+                              alternate: int,
+                              position: int) -> str:
+        key = (nonterminal, alternate, position)
+        name = self._slot_names.get(key)
+        if name is None:
+            name = GrammarSlotDefinition.get_slot_name(nonterminal,
+                                                       alternate,
+                                                       position)
+            self._slot_names[key] = name
+        return name
+
+    def get_and_declare_terminal_check(self, terminal: _cfg.Terminal) -> str:
+        if terminal is _cfg.Terminal.empty():
+            if self._epsilon_check is None:
+                self._epsilon_check = self.get_and_declare_literal_check('')
+            return self._epsilon_check
+        name = self._terminal_checks.get(terminal)
+        if name is None:
+            match terminal:
+                case _cfg.Terminal(ranges=None, sequence=None):
+                    name = self.get_and_declare_literal_check('')
+                case _cfg.Terminal(ranges=None, sequence=seq):
+                    name = self.get_and_declare_literal_check(seq)
+                case _cfg.Terminal(ranges=ranges, sequence=None):
+                    name = self.get_and_declare_range_check(ranges)
+                case _:
+                    raise ValueError(terminal)
+            self._terminal_checks[terminal] = name
+        return name
+
+    def get_and_declare_test_set_checks(
+            self, test_set: frozenset[_cfg.Terminal]) -> tuple[str, ...]:
+        checks = self._test_set_checks.get(test_set)
+        if checks is None:
+            checks = tuple(self.get_and_declare_terminal_check(terminal)
+                           for terminal in test_set)
+            self._test_set_checks[test_set] = checks
+        return checks
+
     def get_and_declare_literal_check(self, literal: str) -> str:
         definition = LiteralCheckDefinition(literal)
-        if definition.name not in self.input_checks:
+        name = definition.name
+        if name not in self.input_checks:
             self.add_input_check(definition)
-        return definition.name
+        return name
 
     def get_and_declare_range_check(self,
                                     ranges: tuple[tuple[int, int], ...]) -> str:
         definition = RangeCheckDefinition(ranges)
-        if definition.name not in self.input_checks:
+        name = definition.name
+        if name not in self.input_checks:
             self.add_input_check(definition)
-        return definition.name
+        return name
 
     def get_and_declare_follow(self, *,
                                slot: str,
@@ -161,9 +227,33 @@ class ParserDefinition:
 
     def _get_and_declare_ambiguity(self,
                                    check: AmbiguityCheckDefinition) -> str:
-        if check.name not in self.ambiguity_checks:
+        name = check.name
+        if name not in self.ambiguity_checks:
             self.add_ambiguity_check(check)
-        return check.name
+        return name
+
+    ###################################################################
+    # Shared statements
+
+    def get_invoke_node_t(self,
+                          target: NodeAssignmentTarget,
+                          check: str) -> InvokeNodeT:
+        key = (InvokeNodeT, target, check)
+        statement = self._node_statements.get(key)
+        if statement is None:
+            statement = InvokeNodeT(target, check)
+            self._node_statements[key] = statement
+        return statement
+
+    def get_invoke_node_p(self,
+                          target: NodeAssignmentTarget,
+                          slot: str) -> InvokeNodeP:
+        key = (InvokeNodeP, target, slot)
+        statement = self._node_statements.get(key)
+        if statement is None:
+            statement = InvokeNodeP(target, slot)
+            self._node_statements[key] = statement
+        return statement
 
     ###################################################################
     # Add functions
@@ -180,6 +270,15 @@ class ParserDefinition:
     def add_goto_entry(self, key: str | None, target: str):
         self.goto[key] = target
 
+    def extend_functions(self, functions: typing.Iterable[FunctionDefinition]):
+        self.parse_functions.update(
+            (function.name, function) for function in functions
+        )
+
+    def extend_goto_entries(self,
+                            entries: typing.Iterable[tuple[str | None, str]]):
+        self.goto.update(entries)
+
     def add_ambiguity_check(self, check: AmbiguityCheckDefinition):
         self.ambiguity_checks[check.name] = check
 
@@ -366,7 +465,7 @@ class Comment(StatementDefinition):
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class ConditionalCheck(StatementDefinition):
-    checks: list[str]
+    checks: tuple[str, ...]
     body: list[StatementDefinition]
 
 
@@ -18,7 +18,22 @@ from .. import abstract_parser as _ast
 
 class PythonCodeGenerator(AbstractCodeGenerator):
 
+    # Range checks consisting of more than this many ranges
+    # are compiled into a regular expression character class,
+    # which is matched by the re module instead of a chain
+    # of Python comparisons.
+    MAX_INLINE_RANGES = 3
+
+    # Conditions testing several single characters are merged
+    # into one set of code points, as long as the set does not
+    # grow larger than this.
+    MAX_CODE_POINT_SET = 64
+
     def generate_code(self, parser: ParserDefinition):
+        patterns = self._get_range_patterns(parser)
+        if patterns:
+            self.writer.write_line('import re')
+            self.writer.write_empty_line()
         imports = [
             'from pygll.core.base import AbstractParser',
             'from pygll.core.nodes import GrammarSlot',
@@ -28,10 +43,15 @@ class PythonCodeGenerator(AbstractCodeGenerator):
             self.writer.write_line(statement)
         self.writer.write_empty_line()
         self.writer.write_empty_line()
+        self._generate_range_patterns(patterns)
         self.writer.write_line(
             f'class {parser.metadata.name}(AbstractParser):'
         )
         with self.writer.increased_indent():
+            # Grammar slots and the goto table are class attributes;
+            # instances only carry the state from AbstractParser.
+            self.writer.write_line('__slots__ = ()')
+            self.writer.write_empty_line()
             self._generate_grammar_slots(parser.all_grammar_slots)
             self.writer.write_empty_line()
             self._generate_abstract_methods(parser)
@@ -72,24 +92,26 @@ class PythonCodeGenerator(AbstractCodeGenerator):
             self.writer.write_line(f'{name} = {slot_definition}')
 
     def _generate_goto(self, goto: dict[str, str]):
-        self.writer.write_line('def goto(self, slot: GrammarSlot):')
+        # The goto table is built once, when the class is created.
+        # Dispatching on a slot is then a single dictionary lookup,
+        # rather than a linear scan over all grammar slots.
+        self.writer.write_line('_goto_table = {')
         with self.writer.increased_indent():
-            self.writer.write_line('match slot:')
             for slot, target in goto.items():
-                with self.writer.increased_indent():
-                    if slot is not None:
-                        self.writer.write_line(f'case self.{slot}:')
-                    else:
-                        self.writer.write_line(f'case None:')
-                    with self.writer.increased_indent():
-                        self.writer.write_line('if self.debug:')
-                        with self.writer.increased_indent():
-                            self.writer.write_line(f'self.on_goto(slot, {target!r})')
-                        self.writer.write_line(f'self.{target}()')
+                self.writer.write_line(f'{slot}: {target},')
+        self.writer.write_line('}')
+        self.writer.write_empty_line()
+        self.writer.write_line('def goto(self, slot: GrammarSlot):')
+        with self.writer.increased_indent():
+            self.writer.write_line('function = self._goto_table.get(slot)')
+            self.writer.write_line('if function is None:')
             with self.writer.increased_indent():
-                self.writer.write_line('case _:')
-                with self.writer.increased_indent():
-                    self.writer.write_line('self.unknown(slot)')
+                self.writer.write_line('self.unknown(slot)')
+                self.writer.write_line('return')
+            self.writer.write_line('if self.debug:')
+            with self.writer.increased_indent():
+                self.writer.write_line('self.on_goto(slot, function.__name__)')
+            self.writer.write_line('function(self)')
 
     def _generate_abstract_methods(self, parser: ParserDefinition):
         self.writer.write_line('def get_final_slot(self):')
@@ -119,10 +141,46 @@ class PythonCodeGenerator(AbstractCodeGenerator):
             else:
                 self.writer.write_line('return True')
 
+    def _get_range_patterns(self,
+                            parser: ParserDefinition) -> list[tuple[str, str]]:
+        patterns = []
+        for check in parser.input_checks.values():
+            if check.get_check_type() != _ast.CheckType.Range:
+                continue
+            assert isinstance(check, _ast.RangeCheckDefinition)
+            if len(check.ranges) <= self.MAX_INLINE_RANGES:
+                continue
+            character_class = ''.join(
+                f'\\U{start:08x}' if start == stop
+                else f'\\U{start:08x}-\\U{stop:08x}'
+                for start, stop in check.ranges
+            )
+            patterns.append(
+                (self._get_range_pattern_name(check), character_class)
+            )
+        return patterns
+
+    def _generate_range_patterns(self, patterns: list[tuple[str, str]]):
+        for name, character_class in patterns:
+            self.writer.write_line(
+                f"{name} = re.compile(r'[{character_class}]')"
+            )
+        if patterns:
+            self.writer.write_empty_line()
+            self.writer.write_empty_line()
+
+    @staticmethod
+    def _get_range_pattern_name(check: _ast.RangeCheckDefinition) -> str:
+        return f'_pattern_{check.name}'
+
     def _generate_range_check(self, check: _ast.RangeCheckDefinition):
         self.writer.write_line(f'def {check.name}(self):')
         with self.writer.increased_indent():
-            self.writer.write_line('char = ord(self.scanner.peek(1))')
+            if len(check.ranges) > self.MAX_INLINE_RANGES:
+                pattern = self._get_range_pattern_name(check)
+                self.writer.write_line(f'return self.scanner.matches({pattern})')
+                return
+            self.writer.write_line('char = self.scanner.peek_code_point()')
             condition = self._get_range_check('char', check.ranges)
             self.writer.write_line(f'return {condition}')
 
@@ -131,8 +189,65 @@ class PythonCodeGenerator(AbstractCodeGenerator):
                            function: _ast.FunctionDefinition):
         self.writer.write_line(f'def {function.name}(self):')
         with self.writer.increased_indent():
+            # Attributes used more than once are bound to locals.
+            shared = self._get_shared_checks(function)
+            uses = {}
+            self._count_attribute_uses(parser, function.body, shared, uses)
+            bound = tuple(name for name, count in uses.items() if count > 1)
+            for name in bound:
+                self.writer.write_line(f'{name} = self.{name}')
+            for check in shared:
+                self.writer.write_line(f'{check} = self.{check}()')
             for statement in function.body:
-                self._write_statement(parser, statement)
+                self._write_statement(parser, statement, shared, bound)
+
+    @classmethod
+    def _count_attribute_uses(cls,
+                              parser: ParserDefinition,
+                              statements: list[_ast.StatementDefinition],
+                              evaluated_checks: tuple[str, ...],
+                              uses: dict[str, int]):
+        for statement in statements:
+            match statement:
+                case _ast.InvokeCreate():
+                    names = ['create']
+                case _ast.InvokeAdd():
+                    names = ['add', 'scanner']
+                case _ast.InvokeNodeT(parent_check=check_name):
+                    check = parser.input_checks[check_name]
+                    if isinstance(check, _ast.LiteralCheckDefinition):
+                        names = ['get_node_t', 'scanner']
+                    else:
+                        names = ['get_node_t', 'scanner', 'scanner']
+                case _ast.InvokeNodeP():
+                    names = ['get_node_p']
+                case _ast.ConditionalCheck(checks=checks, body=body):
+                    condition = cls._get_condition(parser,
+                                                   checks,
+                                                   evaluated_checks,
+                                                   'scanner')
+                    names = ['scanner'] if 'scanner.' in condition else []
+                    cls._count_attribute_uses(parser, body, (), uses)
+                case _:
+                    names = []
+            for name in names:
+                uses[name] = uses.get(name, 0) + 1
+
+    @staticmethod
+    def _get_shared_checks(function: _ast.FunctionDefinition) -> tuple[str, ...]:
+        # Alternates with overlapping test sets share input checks.
+        # When a function only selects alternates (all checks are
+        # done at the same input position), every check which is
+        # used more than once is evaluated once, up front.
+        counts = {}
+        for statement in function.body:
+            if not isinstance(statement, _ast.ConditionalCheck):
+                return ()
+            if not all(isinstance(s, _ast.InvokeAdd) for s in statement.body):
+                return ()
+            for check in statement.checks:
+                counts[check] = counts.get(check, 0) + 1
+        return tuple(check for check, count in counts.items() if count > 1)
 
     def _generate_pop_ambiguity_jump_table(self,
                                            checks: list[_ast.AmbiguityCheckDefinition]):
@@ -200,7 +315,8 @@ class PythonCodeGenerator(AbstractCodeGenerator):
 
     def _generate_precede_or_follow_check_body(self, literals, ranges, negated, peek_function):
         if ranges:
-            self.writer.write_line(f'char = self.scanner.{peek_function}(1)')
+            self.writer.write_line(f'text = self.scanner.{peek_function}(1)')
+            self.writer.write_line('char = ord(text) if text else -1')
             condition = self._get_range_check('char', ranges)
             self.writer.write_line(f'if {condition}:')
             with self.writer.increased_indent():
@@ -239,15 +355,19 @@ class PythonCodeGenerator(AbstractCodeGenerator):
 
     def _write_statement(self,
                          parser: ParserDefinition,
-                         statement: _ast.StatementDefinition):
+                         statement: _ast.StatementDefinition,
+                         evaluated_checks: tuple[str, ...] = (),
+                         bound: tuple[str, ...] = ()):
+        def ref(name: str) -> str:
+            return name if name in bound else f'self.{name}'
         match statement:
             case _ast.InvokeCreate(grammar_slot=slot):
-                self.writer.write_line(f'self.c_u = self.create(self.{slot})')
+                self.writer.write_line(f'self.c_u = {ref("create")}(self.{slot})')
             case _ast.InvokeAdd(grammar_slot=slot):
-                self.writer.write_line(f'self.add('
+                self.writer.write_line(f'{ref("add")}('
                                        f'self.{slot}, '
                                        f'self.c_u, '
-                                       f'self.scanner.position, '
+                                       f'{ref("scanner")}.position, '
                                        f'InitialNode(0, 0))')
             case _ast.CallFunction(function=function):
                 self.writer.write_line(f'self.{function}()')
@@ -255,30 +375,35 @@ class PythonCodeGenerator(AbstractCodeGenerator):
                 self.writer.write_line('self.pop()')
             case _ast.InvokeNodeT(parent_check=check_name, target=target):
                 target = self._resolve_target(target)
+                get_node_t = ref('get_node_t')
+                scanner = ref('scanner')
                 check = parser.input_checks[check_name]
                 if isinstance(check, _ast.LiteralCheckDefinition):
                     self.writer.write_line(
-                        f'{target} = self.get_node_t({check.text!r})'
+                        f'{target} = {get_node_t}({check.text!r})'
                     )
                     self.writer.write_line(
-                        f'self.scanner.advance({len(check.text)})'
+                        f'{scanner}.advance({len(check.text)})'
                     )
                 else:
                     self.writer.write_line(
-                        f'{target} = self.get_node_t(self.scanner.peek(1))'
+                        f'{target} = {get_node_t}({scanner}.peek(1))'
                     )
-                    self.writer.write_line('self.scanner.advance(1)')
+                    self.writer.write_line(f'{scanner}.advance(1)')
             case _ast.InvokeNodeP(grammar_slot=slot):
                 self.writer.write_line(
-                    f'self.c_n = self.get_node_p('
+                    f'self.c_n = {ref("get_node_p")}('
                     f'self.{slot}, self.c_n, self.c_r)'
                 )
             case _ast.ConditionalCheck(checks=checks, body=body):
-                condition = ' or '.join(f'self.{check}()' for check in checks)
+                condition = self._get_condition(parser,
+                                                 checks,
+                                                 evaluated_checks,
+                                                 ref('scanner'))
                 self.writer.write_line(f'if {condition}:')
                 with self.writer.increased_indent():
                     for line in body:
-                        self._write_statement(parser, line)
+                        self._write_statement(parser, line, bound=bound)
             case _ast.Disambiguate(constraint_check=function_name):
                 self.writer.write_line(f'if not self.{function_name}():')
                 with self.writer.increased_indent():
@@ -288,6 +413,69 @@ class PythonCodeGenerator(AbstractCodeGenerator):
             case _:
                 raise ValueError(statement)
 
+    @classmethod
+    def _get_condition(cls,
+                       parser: ParserDefinition,
+                       checks: tuple[str, ...],
+                       evaluated_checks: tuple[str, ...],
+                       scanner: str) -> str:
+        # Checks for a single character (one character literals and
+        # small ranges) are merged into one membership test on the
+        # code point of the next character. Longer literals of the
+        # same length are tested together, using a single lookahead
+        # and a set membership test.
+        code_points = set()
+        single_character_checks = set()
+        literals_by_length = {}
+        for check in checks:
+            if check in evaluated_checks:
+                continue
+            match parser.input_checks[check]:
+                case _ast.LiteralCheckDefinition(text=text) if len(text) == 1:
+                    single_character_checks.add(check)
+                    code_points.add(ord(text))
+                case _ast.LiteralCheckDefinition(text=text) if text:
+                    literals_by_length.setdefault(len(text), []).append(text)
+                case _ast.RangeCheckDefinition(ranges=ranges) if (
+                        sum(stop - start + 1 for start, stop in ranges)
+                        <= cls.MAX_CODE_POINT_SET):
+                    single_character_checks.add(check)
+                    code_points.update(
+                        code_point
+                        for start, stop in ranges
+                        for code_point in range(start, stop + 1)
+                    )
+        if len(single_character_checks) < 2:
+            single_character_checks.clear()
+        conditions = []
+        for check in checks:
+            if check in evaluated_checks:
+                conditions.append(check)
+                continue
+            if check in single_character_checks:
+                if code_points:
+                    formatted = ', '.join(str(x) for x in sorted(code_points))
+                    conditions.append(
+                        f'{scanner}.peek_code_point() in {{{formatted}}}'
+                    )
+                    code_points = None
+                continue
+            definition = parser.input_checks[check]
+            if not isinstance(definition, _ast.LiteralCheckDefinition) or len(definition.text) < 2:
+                conditions.append(f'self.{check}()')
+                continue
+            literals = literals_by_length.pop(len(definition.text), None)
+            if literals is None:
+                continue    # Already part of an earlier membership test
+            if len(literals) == 1:
+                conditions.append(f'self.{check}()')
+            else:
+                formatted = ', '.join(repr(literal) for literal in literals)
+                conditions.append(
+                    f'{scanner}.peek({len(definition.text)}) in {{{formatted}}}'
+                )
+        return ' or '.join(conditions)
+
     @staticmethod
     def _resolve_target(target: _ast.NodeAssignmentTarget):
         match target:
@@ -298,9 +486,16 @@ class PythonCodeGenerator(AbstractCodeGenerator):
 
     @staticmethod
     def _get_range_check(var: str, ranges: tuple[tuple[int, int], ...]) -> str:
-        return ' or '.join(
-            (f'{start} <= {var} <= {stop}'
-             if start != stop
-             else f'start == {var}')
-            for start, stop in ranges
-        )
\ No newline at end of file
+        # Single characters are combined into one membership test;
+        # CPython compiles a set literal of constants into a
+        # frozenset constant, so this costs a single lookup.
+        singletons = [start for start, stop in ranges if start == stop]
+        conditions = [f'{start} <= {var} <= {stop}'
+                      for start, stop in ranges
+                      if start != stop]
+        if len(singletons) == 1:
+            conditions.insert(0, f'{var} == {singletons[0]}')
+        elif singletons:
+            formatted = ', '.join(str(x) for x in singletons)
+            conditions.insert(0, f'{var} in {{{formatted}}}')
+        return ' or '.join(conditions)
\ No newline at end of file
@@ -8,10 +8,9 @@ from __future__ import annotations
 import collections
 import dataclasses
 import functools
+import types
 import typing
 
-from ..util.algorithms import relations
-
 ##############################################################################
 ##############################################################################
 # Auxiliary Classes
@@ -27,6 +26,15 @@ class Nonterminal:
 class Terminal:
     ranges: tuple[tuple[int, int], ...] | None
     sequence: str | None
+    # Terminals are used as keys in all first and follow
+    # computations; hashing the ranges every time is expensive.
+    _hash: int = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_hash', hash((self.ranges, self.sequence)))
+
+    def __hash__(self):
+        return self._hash
 
     @classmethod
     def literal(cls, seq: str) -> Terminal:
@@ -34,7 +42,7 @@ class Terminal:
 
     @classmethod
     def empty(cls) -> Terminal:
-        return cls(ranges=None, sequence=None)
+        return _EMPTY_TERMINAL
 
     @classmethod
     def from_char(cls, char: str) -> Terminal:
@@ -49,11 +57,19 @@ class Terminal:
         return self.ranges is None and self.sequence is None
 
 
+# Epsilon is by far the most common terminal; share a single instance
+# so it can be recognised by identity.
+_EMPTY_TERMINAL = Terminal(ranges=None, sequence=None)
+
+
 Alternative = tuple[Nonterminal | Terminal, ...]
 Expansion = tuple[Alternative, ...]
 
 GLLBlock = list[Terminal | Nonterminal]
 
+# Bit of epsilon in terminal bitsets; epsilon always has index 0
+_EPSILON_BIT = 1
+
 ##############################################################################
 ##############################################################################
 # Context Free Grammar
@@ -70,9 +86,18 @@ class ContextFreeGrammar:
         if rules is None:
             rules = {}
         self.__rules = rules
+        self.__rules_view = types.MappingProxyType(rules)
         self.__start = start
         self.__first = None
         self.__follow = None
+        self.__terminal_ids = None
+        self.__terminals = None
+        self.__first_sets = {}
+        self.__follow_sets = {}
+        self.__test_sets = {}
+        self.__sequence_test_sets = {}
+        self.__sequence_first_sets = {}
+        self.__sequence_follow_sets = {}
 
     @property
     def nonterminals(self) -> frozenset[Nonterminal]:
@@ -114,19 +139,18 @@ class ContextFreeGrammar:
 
     @classmethod
     def __format_symbol(cls, symbol: Nonterminal | Terminal) -> str:
-        match symbol:
-            case Nonterminal(name):
-                return name
-            case Terminal(ranges=None, sequence=None):
+        if isinstance(symbol, Nonterminal):
+            return symbol.name
+        if symbol.ranges is None:
+            if symbol.sequence is None:
                 return '()'
-            case Terminal(ranges=None, sequence=seq):
-                return '"' + seq + '"'
-            case Terminal(ranges=ranges, sequence=None):
-                content = ''.join(
-                    f'{chr(start)}-{chr(end)}' if start != end else chr(start)
-                    for start, end in ranges
-                )
-                return f'[{content}]'
+            return '"' + symbol.sequence + '"'
+        if symbol.sequence is None:
+            content = ''.join(
+                f'{chr(start)}-{chr(end)}' if start != end else chr(start)
+                for start, end in symbol.ranges
+            )
+            return f'[{content}]'
 
     ###################################################################
     # Remove redundant empty symbols
@@ -147,7 +171,7 @@ class ContextFreeGrammar:
 
     def __normalize_alternative(self, alternative: Alternative):
         if all(self.__is_empty_terminal(x) for x in alternative):
-            return Terminal.empty(),
+            return _EMPTY_TERMINAL,
         return tuple(x
                      for x in alternative
                      if not self.__is_empty_terminal(x))
@@ -166,54 +190,56 @@ class ContextFreeGrammar:
 
     @classmethod
     def __compress_alternatives(cls, alternatives: Expansion):
-        return tuple(cls.__compress_alternative(alternative)
+        # One buffer is shared by all alternatives
+        buffer = []
+        return tuple(cls.__compress_alternative(alternative, buffer)
                      for alternative in alternatives)
 
     @classmethod
-    def __compress_alternative(cls, alternative: Alternative):
+    def __compress_alternative(cls,
+                               alternative: Alternative,
+                               buffer: list[str]):
         parts = []
-        current_seq = []
         for symbol in alternative:
             if isinstance(symbol, Terminal) and cls.__is_literal(symbol):
-                current_seq.append(cls.__get_literal(symbol))
+                buffer.append(cls.__get_literal(symbol))
             else:
-                if current_seq:
-                    part = Terminal.literal(''.join(current_seq))
-                    if not part.sequence:
-                        parts.append(Terminal.empty())
-                    else:
-                        parts.append(part)
-                    current_seq = []
+                if buffer:
+                    parts.append(cls.__flush_literal(buffer))
                 parts.append(symbol)
-        if current_seq:
-            part = Terminal.literal(''.join(current_seq))
-            if not part.sequence:
-                parts.append(Terminal.empty())
-            else:
-                parts.append(part)
+        if buffer:
+            parts.append(cls.__flush_literal(buffer))
         return tuple(parts)
 
+    @staticmethod
+    def __flush_literal(buffer: list[str]) -> Terminal:
+        # A run of only empty terminals joins to ''
+        sequence = ''.join(buffer)
+        buffer.clear()
+        if not sequence:
+            return _EMPTY_TERMINAL
+        return Terminal.literal(sequence)
+
     @classmethod
     def __is_literal(cls, symbol):
-        match symbol:
-            case Terminal(ranges=None, sequence=_):
-                return True
-            case Terminal(ranges=((x, y),), sequence=None):
-                return x == y
-            case _:
-                return False
+        ranges = symbol.ranges
+        if ranges is None:
+            return True
+        return (
+            symbol.sequence is None and
+            len(ranges) == 1 and
+            ranges[0][0] == ranges[0][1]
+        )
 
     @classmethod
     def __get_literal(cls, symbol):
-        match symbol:
-            case Terminal(ranges=None, sequence=None):
+        if symbol.ranges is None:
+            if symbol.sequence is None:
                 return ''
-            case Terminal(ranges=None, sequence=seq):
-                return seq
-            case Terminal(ranges=((x, y),), sequence=None) if x == y:
-                return chr(x)
-            case _:
-                raise ValueError(f'{symbol} is not a literal')
+            return symbol.sequence
+        if cls.__is_literal(symbol):
+            return chr(symbol.ranges[0][0])
+        raise ValueError(f'{symbol} is not a literal')
 
     ###################################################################
     # Properties and basic interface
@@ -223,14 +249,30 @@ class ContextFreeGrammar:
         return self.__start
 
     @property
-    def rules(self) -> dict[Nonterminal, Expansion]:
-        return self.__rules.copy()
+    def rules(self) -> typing.Mapping[Nonterminal, Expansion]:
+        # Read-only view; use add_rule to modify the grammar
+        return self.__rules_view
 
     def add_rule(self, symbol: Nonterminal, expansion: Expansion):
         if symbol in self.__rules:
             self.__rules[symbol] += expansion
         else:
             self.__rules[symbol] = expansion
+        self.__invalidate_caches()
+
+    def __invalidate_caches(self):
+        self.__first = None
+        self.__follow = None
+        self.__terminal_ids = None
+        self.__terminals = None
+        self.__first_sets.clear()
+        self.__follow_sets.clear()
+        self.__test_sets.clear()
+        self.__sequence_test_sets.clear()
+        self.__sequence_first_sets.clear()
+        self.__sequence_follow_sets.clear()
+        self.__dict__.pop('nullables', None)
+        self.__dict__.pop('reachable_nonterminals', None)
 
     ###################################################################
     # Computing first and follow sets
@@ -239,63 +281,123 @@ class ContextFreeGrammar:
                           nonterminal: Nonterminal,
                           alternate: int,
                           index: int) -> frozenset[Terminal]:
-        epsilon = Terminal.empty()
-        if self.__rules[nonterminal][alternate][index:] == (epsilon,):
+        key = (nonterminal, alternate, index)
+        test = self.__sequence_test_sets.get(key)
+        if test is None:
+            test = self.__compute_test_for_sequence(nonterminal,
+                                                    alternate,
+                                                    index)
+            self.__sequence_test_sets[key] = test
+        return test
+
+    def __compute_test_for_sequence(self,
+                                    nonterminal: Nonterminal,
+                                    alternate: int,
+                                    index: int) -> frozenset[Terminal]:
+        epsilon = _EMPTY_TERMINAL
+        alternative = self.__rules[nonterminal][alternate]
+        if index == len(alternative) - 1 and alternative[index] == epsilon:
             return frozenset({epsilon})
         first = self.first_for_sequence(nonterminal, alternate, index)
-        if any(self.__is_empty_terminal(x) for x in first):
+        if epsilon in first:
             follow = self.follow_for_sequence(nonterminal, alternate, index)
             return first | follow
         return first
 
     def test(self,
              symbol: Nonterminal | Terminal) -> frozenset[Terminal]:
-        first = self.first(symbol)
-        if any(self.__is_empty_terminal(x) for x in first):
-            return first | self.follow(symbol)
-        return first
+        test = self.__test_sets.get(symbol)
+        if test is None:
+            test = self.first(symbol)
+            if isinstance(symbol, Terminal):
+                nullable = self.__is_empty_terminal(symbol)
+            else:
+                nullable = self.__first_bits(symbol) & _EPSILON_BIT
+            if nullable:
+                test |= self.follow(symbol)
+            self.__test_sets[symbol] = test
+        return test
 
-    @functools.cache
     def first_for_sequence(self,
                            nonterminal: Nonterminal,
                            alternate: int,
                            index: int) -> frozenset[Terminal]:
-        sequence = self.__rules[nonterminal][alternate][index:]
-        first = set()
-        epsilon = Terminal.empty()
-        for symbol in sequence:
-            addition = self.first(symbol)
-            first |= addition - {epsilon}
-            if epsilon not in addition:
+        key = (nonterminal, alternate, index)
+        cached = self.__sequence_first_sets.get(key)
+        if cached is not None:
+            return cached
+        alternative = self.__rules[nonterminal][alternate]
+        first = 0
+        for position in range(index, len(alternative)):
+            addition = self.__first_bits(alternative[position])
+            first |= addition & ~_EPSILON_BIT
+            if not addition & _EPSILON_BIT:
                 break
         else:
-            first.add(epsilon)
-        return frozenset(first)
+            first |= _EPSILON_BIT
+        result = self.__sequence_first_sets[key] = self.__decode_terminals(first)
+        return result
 
     def first(self, x: Nonterminal | Terminal) -> frozenset[Terminal]:
-        if self.__first is None:
-            # first(x) can be computed by considering the
-            # transitive closure of the relation R defined
-            # by: x R y if and only if
-            #       1) x -> y, or
-            #       2) x -> yz, or
-            #       3) x -> wyz
-            # Here, z is any arbitrary sequence of terminals
-            # and nonterminals. w is a sequence of nullable
-            # nonterminals.
-            # In the following code, we first build this relation.
-            # Next, we compute the transitive closure.
-            # The transitive closure immediately gives us
-            # first(x).
-            pairs = self.__build_directly_followed_by_relation()
-            rel = relations.Relation(pairs)
-            self.__first = {
-                key: [x for x in value if isinstance(x, Terminal)]
-                for key, value in rel.transitive_closure().as_dict().items()
-            }
+        first = self.__first_sets.get(x)
+        if first is None:
+            if isinstance(x, Terminal):
+                first = frozenset({x})
+            else:
+                first = self.__decode_terminals(self.__first_bits(x))
+            self.__first_sets[x] = first
+        return first
+
+    def __first_bits(self, x: Nonterminal | Terminal) -> int:
         if isinstance(x, Terminal):
-            return frozenset({x})
-        return frozenset(self.__first[x])
+            return self.__encode_terminals((x,))
+        if self.__first is None:
+            self.__build_first_mapping()
+        return self.__first[x]
+
+    def __build_first_mapping(self):
+        # first(x) can be computed by considering the
+        # transitive closure of the relation R defined
+        # by: x R y if and only if
+        #       1) x -> y, or
+        #       2) x -> yz, or
+        #       3) x -> wyz
+        # Here, z is any arbitrary sequence of terminals
+        # and nonterminals. w is a sequence of nullable
+        # nonterminals.
+        # Only the terminals in the closure are needed,
+        # so instead of computing the full closure, the
+        # terminals (as bitsets) are propagated backwards
+        # along the relation using a worklist.
+        # The empty terminal is not propagated: x -> yz
+        # does not make x nullable if y is. Instead, it is
+        # added to the first sets of the nullables afterwards.
+        first_mapping = {}
+        predecessors = collections.defaultdict(list)
+        for x, y in self.__build_directly_followed_by_relation():
+            bits = first_mapping.get(x, 0)
+            if isinstance(y, Nonterminal):
+                predecessors[y].append(x)
+            elif not self.__is_empty_terminal(y):
+                bits |= self.__encode_terminals((y,))
+            first_mapping[x] = bits
+        worklist = collections.deque(first_mapping)
+        queued = set(first_mapping)
+        while worklist:
+            y = worklist.popleft()
+            queued.discard(y)
+            bits = first_mapping[y]
+            for x in predecessors[y]:
+                # first(y) <= first(x)
+                new = first_mapping[x] | bits
+                if new != first_mapping[x]:
+                    first_mapping[x] = new
+                    if x not in queued:
+                        queued.add(x)
+                        worklist.append(x)
+        for x in self.nullables:
+            first_mapping[x] |= _EPSILON_BIT
+        self.__first = first_mapping
 
     def __build_directly_followed_by_relation(self) -> set[tuple[Nonterminal, Terminal]]:
         pairs = set()
@@ -307,36 +409,46 @@ class ContextFreeGrammar:
                         if symbol not in self.nullables:
                             break
                     elif self.__is_empty_terminal(symbol):
-                        pairs.add((nonterminal, Terminal.empty()))
+                        pairs.add((nonterminal, _EMPTY_TERMINAL))
                     else:
                         pairs.add((nonterminal, symbol))
                         break
                 else:
-                    pairs.add((nonterminal, Terminal.empty()))
+                    pairs.add((nonterminal, _EMPTY_TERMINAL))
         return pairs
 
-    @functools.cache
     def follow_for_sequence(self,
                             nonterminal: Nonterminal,
                             alternate: int,
                             index: int) -> frozenset[Terminal]:
-        sequence = self.__rules[nonterminal][alternate][index+1:]
-        follow = set()
-        epsilon = Terminal.empty()
-        for symbol in sequence:
-            first = self.first(symbol)
-            follow |= (first - {epsilon})
-            if epsilon not in first:
+        key = (nonterminal, alternate, index)
+        cached = self.__sequence_follow_sets.get(key)
+        if cached is not None:
+            return cached
+        alternative = self.__rules[nonterminal][alternate]
+        follow = 0
+        for position in range(index + 1, len(alternative)):
+            first = self.__first_bits(alternative[position])
+            follow |= first & ~_EPSILON_BIT
+            if not first & _EPSILON_BIT:
                 break
         else:
-            follow |= self.follow(nonterminal)
-        return frozenset(follow)
+            follow |= self.__follow_bits(nonterminal)
+        result = self.__sequence_follow_sets[key] = self.__decode_terminals(follow)
+        return result
 
     def follow(self, x: Nonterminal) -> frozenset[Terminal]:
+        follow = self.__follow_sets.get(x)
+        if follow is None:
+            follow = self.__decode_terminals(self.__follow_bits(x))
+            self.__follow_sets[x] = follow
+        return follow
+
+    def __follow_bits(self, x: Nonterminal) -> int:
         if self.__follow is None:
             # Initialize follow mapping
             self.__build_follow_mapping()
-        return frozenset(self.__follow[x])
+        return self.__follow[x]
 
     def __build_follow_mapping(self):
         # There are two steps. First, we compute the
@@ -346,71 +458,131 @@ class ContextFreeGrammar:
         # We also build the initial follow sets using the
         # first(x) sets.
         # The second step is to build the follow(x) mapping
-        # using a simple fixed-point algorithm:
-        # we keep updating the final result until
-        # no more changes occur.
+        # using a worklist algorithm: whenever follow(x)
+        # grows, it is propagated to all y with
+        # follow(x) <= follow(y).
+
+        # Follow sets are represented as bitsets over the
+        # terminal ids (see __encode_terminals).
+
+        # Nonterminals are numbered in order of appearance;
+        # follow_bits and successors are indexed by these numbers.
+        nonterminal_ids = {}
+        follow_bits = []
+        successors = []
+
+        def get_id(x: Nonterminal) -> int:
+            x_id = nonterminal_ids.get(x)
+            if x_id is None:
+                x_id = nonterminal_ids[x] = len(follow_bits)
+                follow_bits.append(0)
+                successors.append([])
+            return x_id
 
         # Step 1:
-        follow_mapping = collections.defaultdict(set)
         follow_relations = set()
-        epsilon = Terminal.empty()
-        epsilon_set = {epsilon}
         for nonterminal, alternatives in self.__rules.items():
             for alternative in alternatives:
-                for index, symbol in enumerate(alternative):
-                    if isinstance(symbol, Terminal):
-                        continue
-                    assert isinstance(symbol, Nonterminal)
-                    remainder = alternative[index+1:]
-                    if not remainder:
-                        # Rule of the form A -> pB
-                        # follow(A) <= follow(B),
-                        # since every item in follow(A)
-                        # can also follow B.
-                        follow_relations.add((nonterminal, symbol))
-                        continue
-                    for remainder_symbol in remainder:
-                        first = self.first(remainder_symbol)
-                        follow_mapping[symbol] |= first - epsilon_set
-                        if epsilon not in first:
-                            break
+                # Walk the alternative backwards, keeping track of
+                # first(q) for the remainder q, and whether q is
+                # nullable. Every first set is looked up once.
+                remainder_first = 0
+                remainder_nullable = True
+                for symbol in reversed(alternative):
+                    if isinstance(symbol, Nonterminal):
+                        symbol_id = get_id(symbol)
+                        follow_bits[symbol_id] |= remainder_first
+                        if remainder_nullable:
+                            # Rule of the form A -> pBq, where
+                            # q is empty or nullable.
+                            # This means that every item in follow(A)
+                            # may follow B; follow(A) <= follow(B)
+                            follow_relations.add((get_id(nonterminal), symbol_id))
+                    first = self.__first_bits(symbol)
+                    if first & _EPSILON_BIT:
+                        remainder_first |= first & ~_EPSILON_BIT
                     else:
-                        # Rule of the form A -> pBq, where
-                        # q is nullable (epsilon in first(q)).
-                        # This means that every item in follow(A)
-                        # may follow B; follow(A) <= follow(B)
-                        follow_relations.add((nonterminal, symbol))
+                        remainder_first = first
+                        remainder_nullable = False
 
         # Step 2:
-        while True:
-            changed = False
-            for x, y in follow_relations:
+        for x, y in follow_relations:
+            successors[x].append(y)
+        worklist = collections.deque(
+            x for x, targets in enumerate(successors) if targets
+        )
+        queued = [False] * len(follow_bits)
+        for x in worklist:
+            queued[x] = True
+        while worklist:
+            x = worklist.popleft()
+            queued[x] = False
+            bits = follow_bits[x]
+            for y in successors[x]:
                 # follow(x) <= follow(y)
-                if not (follow_mapping[x] <= follow_mapping[y]):
-                    changed = True
-                    follow_mapping[y] |= follow_mapping[x]
-            if not changed:
-                break
+                new = follow_bits[y] | bits
+                if new != follow_bits[y]:
+                    follow_bits[y] = new
+                    if not queued[y]:
+                        queued[y] = True
+                        worklist.append(y)
+
+        self.__follow = {
+            x: follow_bits[x_id] for x, x_id in nonterminal_ids.items()
+        }
 
-        self.__follow = dict(follow_mapping)
+    ###################################################################
+    # Terminal bitsets
+
+    def __intern_terminals(self):
+        # Assign every terminal in the grammar a bit index.
+        # Epsilon always gets index 0.
+        epsilon = _EMPTY_TERMINAL
+        terminals = [epsilon]
+        terminal_ids = {epsilon: 0}
+        for alternatives in self.__rules.values():
+            for alternative in alternatives:
+                for symbol in alternative:
+                    if isinstance(symbol, Terminal) and symbol not in terminal_ids:
+                        terminal_ids[symbol] = len(terminals)
+                        terminals.append(symbol)
+        self.__terminal_ids = terminal_ids
+        self.__terminals = terminals
+
+    def __encode_terminals(self, terminals: typing.Iterable[Terminal]) -> int:
+        if self.__terminal_ids is None:
+            self.__intern_terminals()
+        bits = 0
+        for terminal in terminals:
+            bits |= 1 << self.__terminal_ids[terminal]
+        return bits
+
+    def __decode_terminals(self, bits: int) -> frozenset[Terminal]:
+        if self.__terminals is None:
+            self.__intern_terminals()
+        terminals = self.__terminals
+        result = []
+        while bits:
+            lowest = bits & -bits
+            result.append(terminals[lowest.bit_length() - 1])
+            bits ^= lowest
+        return frozenset(result)
 
     ###################################################################
     # Handling of reachable nonterminals
 
     @functools.cached_property
     def reachable_nonterminals(self) -> frozenset[Nonterminal]:
-        reachables = set()
+        reachables = {self.__start}
         new = collections.deque()
         new.append(self.__start)
         while new:
             start = new.popleft()
-            reachables |= {
-                symbol
-                for alternative in self.__rules[start]
-                for symbol in alternative
-                if isinstance(symbol, Nonterminal)
-
-            }
+            for alternative in self.__rules.get(start, ()):
+                for symbol in alternative:
+                    if isinstance(symbol, Nonterminal) and symbol not in reachables:
+                        reachables.add(symbol)
+                        new.append(symbol)
         return frozenset(reachables)
 
     ###################################################################
@@ -418,32 +590,45 @@ class ContextFreeGrammar:
 
     @functools.cached_property
     def nullables(self) -> frozenset[Nonterminal]:
+        # Every rule which does not contain a non-empty terminal
+        # keeps a count of the nonterminals in it which are not
+        # (yet) known to be nullable. Once the count drops to
+        # zero, the nonterminal of the rule is nullable.
         nullables = set()
-        universe = set(self.__rules)
-        while True:
-            additions = {
-                nonterminal
-                for nonterminal in universe
-                for rule in self.__rules[nonterminal]
-                if self.__rule_is_nullable(rule, nullables)
-            }
-            if additions <= nullables:
-                break
-            nullables |= additions
+        heads = []
+        pending = []
+        occurrences = collections.defaultdict(list)
+        worklist = collections.deque()
+        for nonterminal, alternatives in self.__rules.items():
+            for rule in alternatives:
+                if not self.__rule_may_be_nullable(rule):
+                    continue
+                rule_index = len(heads)
+                heads.append(nonterminal)
+                count = 0
+                for symbol in rule:
+                    if isinstance(symbol, Nonterminal):
+                        occurrences[symbol].append(rule_index)
+                        count += 1
+                pending.append(count)
+                if not count:
+                    worklist.append(nonterminal)
+        while worklist:
+            nonterminal = worklist.popleft()
+            if nonterminal in nullables:
+                continue
+            nullables.add(nonterminal)
+            for rule_index in occurrences[nonterminal]:
+                pending[rule_index] -= 1
+                if not pending[rule_index]:
+                    worklist.append(heads[rule_index])
         return frozenset(nullables)
 
     @classmethod
-    def __rule_is_nullable(cls,
-                           rule: Alternative,
-                           nullables: set[Nonterminal]) -> bool:
+    def __rule_may_be_nullable(cls, rule: Alternative) -> bool:
         for symbol in rule:
-            if isinstance(symbol, Nonterminal):
-                if symbol not in nullables:
-                    return False
-            else:
-                assert isinstance(symbol, Terminal)
-                if not cls.__is_empty_terminal(symbol):
-                    return False
+            if isinstance(symbol, Terminal) and not cls.__is_empty_terminal(symbol):
+                return False
         return True
 
     ###################################################################
@@ -451,7 +636,8 @@ class ContextFreeGrammar:
 
     @staticmethod
     def __is_empty_terminal(x: Terminal) -> bool:
-        return x.ranges is None and x.sequence is None
+        # Epsilon is normally the shared instance
+        return x is _EMPTY_TERMINAL or (x.ranges is None and x.sequence is None)
 
     ###################################################################
     # GLL Specific functions
@@ -472,22 +658,15 @@ class ContextFreeGrammar:
            3) a sequence of terminals, which is (in the alternate)
                not followed by a literal
         """
+        # Every nonterminal ends a block; one pass over the
+        # alternate suffices.
         start = 0
-        stop = 0
-        last_is_nonterminal = False
-        while start < len(alternate):
-            while stop < len(alternate) and cls.is_terminal(alternate[stop]):
-                stop += 1
-            if stop == len(alternate):
-                block = alternate[start:stop]
-                yield start, block
-                last_is_nonterminal = not cls.is_terminal(block[-1])
-                break
-            else:
-                stop += 1
-                block = alternate[start:stop]
-                yield start, block
-                last_is_nonterminal = not cls.is_terminal(block[-1])
-            start = stop
-        if last_is_nonterminal:
+        for stop, symbol in enumerate(alternate, start=1):
+            if not cls.is_terminal(symbol):
+                yield start, alternate[start:stop]
+                start = stop
+        if start < len(alternate):
+            yield start, alternate[start:]
+        elif alternate:
+            # The alternate ends with a nonterminal
             yield len(alternate), ()
@@ -3,7 +3,6 @@
 # Imports
 ##############################################################################
 
-import functools
 import typing
 
 from ..util.algorithms import int_sets as _int_sets
@@ -20,6 +19,11 @@ TagName = typing.Literal['precede',
                          'restrict']
 Tag = tuple[TagName, typing.Any]
 
+_I = typing.TypeVar('_I')
+
+# All code points
+_UNIVERSE = (0, 0x10FFFF)
+
 ##############################################################################
 ##############################################################################
 # Functionality for generating functions for parsing alternates
@@ -48,31 +52,63 @@ def _generate_start_nonterminal_functions(definition: _ast.ParserDefinition,
 def _generate_functions_for_rules(definition: _ast.ParserDefinition,
                                   grammar: _cfg.ContextFreeGrammar,
                                   tags: dict[GrammarPosition, list[Tag]]):
+    # Tags are looked up per grammar position; group them by
+    # alternate, so lookups only use the position.
+    tags_by_alternate = {}
+    for (nonterminal, alternate_number, position), tags_at_pos in tags.items():
+        tags_by_alternate.setdefault(
+            (nonterminal, alternate_number), {}
+        )[position] = tags_at_pos
     for nonterminal, expansion in grammar.rules.items():
-        _generate_start_function(nonterminal, definition, grammar, tags)
+        # Slots at the start of every alternate; used by both the
+        # start function and the goto entries of the first blocks.
+        start_slots = [
+            definition.get_and_declare_grammar_slot(nonterminal.name,
+                                                    alternate_number,
+                                                    0,
+                                                    grammar)
+            for alternate_number in range(len(expansion))
+        ]
+        start_function_name = f'nonterminal_check_{nonterminal.name}'
+        _generate_start_function(nonterminal,
+                                 start_function_name,
+                                 start_slots,
+                                 definition,
+                                 grammar,
+                                 tags)
+        functions = []
+        goto_entries = []
         for alternate_number, alternate in enumerate(expansion):
-            gll_blocks = list(grammar.compute_gll_blocks(alternate))
-            blocks_and_indices = enumerate(gll_blocks)
-            for block_number, (block_index, gll_block) in blocks_and_indices:
+            alternate_tags = tags_by_alternate.get(
+                (nonterminal, alternate_number), {}
+            )
+            base_name = f'{start_function_name}{alternate_number}'
+            gll_blocks = _with_last(grammar.compute_gll_blocks(alternate))
+            for block_number, ((block_index, gll_block), is_last) in enumerate(gll_blocks):
                 # Get function body
                 body = _generate_gll_block_function(
                     definition, gll_block, nonterminal, alternate_number,
                     block_index, block_number, block_number == 0,
-                    block_number == len(gll_blocks) - 1, grammar, tags)
+                    is_last, grammar, alternate_tags)
                 # Get function name
                 if block_number == 0:
-                    function_name = f'nonterminal_check_{nonterminal.name}{alternate_number}'
+                    function_name = base_name
                 else:
-                    function_name = f'nonterminal_check_{nonterminal.name}{alternate_number}_{block_number}'
-                # Add function to parser
-                definition.add_function(
+                    function_name = f'{base_name}_{block_number}'
+                functions.append(
                     _ast.FunctionDefinition(name=function_name, body=body)
                 )
-                # Add goto entry
-                grammar_slot = definition.get_and_declare_grammar_slot(
-                    nonterminal.name, alternate_number, block_index, grammar
-                )
-                definition.add_goto_entry(grammar_slot, function_name)
+                # Get goto entry
+                if block_number == 0:
+                    grammar_slot = start_slots[alternate_number]
+                else:
+                    grammar_slot = definition.get_and_declare_grammar_slot(
+                        nonterminal.name, alternate_number, block_index, grammar
+                    )
+                goto_entries.append((grammar_slot, function_name))
+        # Add functions and goto entries of the rule to the parser
+        definition.extend_functions(functions)
+        definition.extend_goto_entries(goto_entries)
 
 
 ##############################################################################
@@ -82,26 +118,24 @@ def _generate_functions_for_rules(definition: _ast.ParserDefinition,
 
 
 def _generate_start_function(nonterminal: _cfg.Nonterminal,
+                             function_name: str,
+                             start_slots: list[str],
                              definition: _ast.ParserDefinition,
                              grammar: _cfg.ContextFreeGrammar,
                              tags: dict[GrammarPosition, list[Tag]]):
     body = []
-    for alternate_number, alternate in enumerate(grammar.rules[nonterminal]):
+    for alternate_number, slot_name in enumerate(start_slots):
         test_set = grammar.test_for_sequence(nonterminal,
                                              alternate_number,
                                              0)
-        slot_name = definition.get_and_declare_grammar_slot(nonterminal.name,
-                                                            alternate_number,
-                                                            0,
-                                                            grammar)
         body.append(
-            _ast.ConditionalCheck(checks=_test_set_to_checks(definition,
-                                                             test_set),
-                                  body=[_ast.InvokeAdd(slot_name)])
+            _ast.ConditionalCheck(
+                checks=definition.get_and_declare_test_set_checks(test_set),
+                body=[_ast.InvokeAdd(slot_name)]
+            )
         )
     definition.add_function(
-        _ast.FunctionDefinition(name=f'nonterminal_check_{nonterminal.name}',
-                                body=body)
+        _ast.FunctionDefinition(name=function_name, body=body)
     )
 
 
@@ -120,66 +154,55 @@ def _generate_gll_block_function(definition: _ast.ParserDefinition,
                                  first_symbol: bool,
                                  add_pop: bool,
                                  grammar: _cfg.ContextFreeGrammar,
-                                 tags: dict[GrammarPosition, list[Tag]]
+                                 alternate_tags: dict[int, list[Tag]]
                                  ) -> list[_ast.StatementDefinition]:
-    body = [
-        _generate_grammar_slot_comment(nonterminal,
-                                       alternate_number,
-                                       absolute_position,
-                                       grammar)
-    ]
-    if gll_block:
-        # body.extend(
-        #     _generate_precede_checks(definition,
-        #                              nonterminal,
-        #                              alternate_number,
-        #                              absolute_position,
-        #                              grammar,
-        #                              tags)
-        # )
-        if isinstance(gll_block[0], _cfg.Terminal):
-            new_statements, inner_body = _generate_gll_block_function_for_terminal(
-                definition, gll_block, nonterminal, alternate_number,
-                absolute_position, block_number, first_symbol, add_pop, grammar, tags
+    body = []
+    # Statements for every symbol are nested inside the conditional
+    # generated for the previous symbol (if any). inner_body is the
+    # list new statements must be added to.
+    inner_body = body
+    for offset, symbol in enumerate(gll_block):
+        position = absolute_position + offset
+        inner_body.append(
+            _generate_grammar_slot_comment(nonterminal,
+                                           alternate_number,
+                                           position,
+                                           grammar)
+        )
+        if isinstance(symbol, _cfg.Terminal):
+            inner_body = _generate_gll_block_function_for_terminal(
+                definition, inner_body, symbol, nonterminal, alternate_number,
+                position, first_symbol and offset == 0,
+                offset == len(gll_block) - 1, grammar, alternate_tags
             )
         else:
-            new_statements, inner_body = _generate_gll_block_function_for_nonterminal(
-                definition, gll_block, nonterminal, alternate_number,
-                absolute_position, block_number, first_symbol, add_pop, grammar, tags
+            inner_body = _generate_gll_block_function_for_nonterminal(
+                definition, inner_body, symbol, nonterminal, alternate_number,
+                position, first_symbol and offset == 0, grammar, alternate_tags
             )
-        tail = _generate_gll_block_function(definition,
-                                            gll_block[1:],
-                                            nonterminal,
-                                            alternate_number,
-                                            absolute_position + 1,
-                                            block_number,
-                                            False,
-                                            add_pop,
-                                            grammar,
-                                            tags)
-
-        # Add new statements before tail in case new_statements is inner_body
-        inner_body.extend(tail)
-        body.extend(new_statements)
-    elif add_pop:
-        body.append(_ast.InvokePop())
+    inner_body.append(
+        _generate_grammar_slot_comment(nonterminal,
+                                       alternate_number,
+                                       absolute_position + len(gll_block),
+                                       grammar)
+    )
+    if add_pop:
+        inner_body.append(_ast.InvokePop())
     return body
 
 
-_T = tuple[list[_ast.StatementDefinition], list[_ast.StatementDefinition]]
-
-
 def _generate_gll_block_function_for_terminal(
         definition: _ast.ParserDefinition,
-        gll_block: _cfg.GLLBlock,
+        body: list[_ast.StatementDefinition],
+        symbol: _cfg.Terminal,
         nonterminal: _cfg.Nonterminal,
         alternate_number: int,
         absolute_position: int,
-        block_number: int,
         first_symbol: bool,
-        add_pop: bool,
+        last_symbol: bool,
         grammar: _cfg.ContextFreeGrammar,
-        tags: dict[GrammarPosition, list[Tag]]) -> _T:
+        alternate_tags: dict[int, list[Tag]]
+        ) -> list[_ast.StatementDefinition]:
     # This function generates the body of the function
     # responsible for generating a GLL block.
     # This function also inserts the ambiguity checks
@@ -192,64 +215,72 @@ def _generate_gll_block_function_for_terminal(
     # check if needed. The checks are generated in
     # mutually exclusive scenarios, so no double
     # check can be generated.
-    body = []
-    head_check = _terminal_to_check(definition, gll_block[0])
-    if first_symbol and len(gll_block) != 1:
+    #
+    # Statements are appended to body. The list subsequent
+    # statements must be added to is returned.
+    head_check = definition.get_and_declare_terminal_check(symbol)
+    if first_symbol and not last_symbol:
         body.extend(
             _generate_ambiguity_checks(definition,
                                        nonterminal,
                                        alternate_number,
                                        absolute_position,
                                        grammar,
-                                       tags)
+                                       alternate_tags)
+        )
+        body.append(
+            definition.get_invoke_node_t(_ast.NodeAssignmentTarget.CN,
+                                         head_check)
         )
-        body.append(_ast.InvokeNodeT(_ast.NodeAssignmentTarget.CN,
-                                     head_check))
     if not first_symbol:
         inner_body = []
         conditional = _ast.ConditionalCheck(
-            checks=[_terminal_to_check(definition, gll_block[0])],
+            checks=(head_check,),
             body=inner_body
         )
         body.append(conditional)
     else:
         inner_body = body
-    if (first_symbol and len(gll_block) == 1) or not first_symbol:
+    if (first_symbol and last_symbol) or not first_symbol:
         inner_body.extend(
             _generate_ambiguity_checks(definition,
                                        nonterminal,
                                        alternate_number,
                                        absolute_position,
                                        grammar,
-                                       tags)
+                                       alternate_tags)
+        )
+        inner_body.append(
+            definition.get_invoke_node_t(_ast.NodeAssignmentTarget.CR,
+                                         head_check)
         )
-        inner_body.append(_ast.InvokeNodeT(_ast.NodeAssignmentTarget.CR,
-                                           head_check))
         next_slot_name = definition.get_and_declare_grammar_slot(
             nonterminal.name, alternate_number, absolute_position + 1, grammar
         )
-        inner_body.append(_ast.InvokeNodeP(_ast.NodeAssignmentTarget.CN,
-                                           next_slot_name))
-    return body, inner_body
+        inner_body.append(
+            definition.get_invoke_node_p(_ast.NodeAssignmentTarget.CN,
+                                         next_slot_name)
+        )
+    return inner_body
 
 
 def _generate_gll_block_function_for_nonterminal(
         definition: _ast.ParserDefinition,
-        gll_block: _cfg.GLLBlock,
+        body: list[_ast.StatementDefinition],
+        symbol: _cfg.Nonterminal,
         nonterminal: _cfg.Nonterminal,
         alternate_number: int,
         absolute_position: int,
-        block_number: int,
         first_symbol: bool,
-        add_pop: bool,
         grammar: _cfg.ContextFreeGrammar,
-        tags: dict[GrammarPosition, list[Tag]]) -> _T:
+        alternate_tags: dict[int, list[Tag]]
+        ) -> list[_ast.StatementDefinition]:
     # First, check whether we need a conditional
-    body = []
     if not first_symbol:
         inner_body = []
-        test_functions = _test_set_to_checks(definition,
-                                             grammar.test(gll_block[0]))
+        test_functions = definition.get_and_declare_test_set_checks(
+            grammar.test(symbol)
+        )
         conditional = _ast.ConditionalCheck(checks=test_functions,
                                             body=inner_body)
         body.append(conditional)
@@ -262,7 +293,7 @@ def _generate_gll_block_function_for_nonterminal(
                                    alternate_number,
                                    absolute_position,
                                    grammar,
-                                   tags)
+                                   alternate_tags)
     )
     grammar_slot_name = definition.get_and_declare_grammar_slot(
         nonterminal.name, alternate_number, absolute_position + 1, grammar
@@ -271,15 +302,15 @@ def _generate_gll_block_function_for_nonterminal(
     # TODO: insert precede check? What about the conditional?
     inner_body.append(_ast.InvokeCreate(grammar_slot_name))
     inner_body.append(
-        _ast.CallFunction(f'nonterminal_check_{gll_block[0].name}')
+        _ast.CallFunction(f'nonterminal_check_{symbol.name}')
     )
     inner_body.append(
         _ast.Comment(f'Parsing is resumed via a descriptor '
-                     f'`add()`ed by `pop()` when {gll_block[0].name} '
+                     f'`add()`ed by `pop()` when {symbol.name} '
                      f'has been successfully parsed.')
     )
-    # Return result
-    return body, inner_body
+    # Return the list subsequent statements must be added to
+    return inner_body
 
 
 ##############################################################################
@@ -293,17 +324,19 @@ def _generate_ambiguity_checks(definition: _ast.ParserDefinition,
                                alternate_number: int,
                                absolute_position: int,
                                grammar: _cfg.ContextFreeGrammar,
-                               tags: dict[GrammarPosition, list[Tag]]):
-    key = (nonterminal, alternate_number, absolute_position)
-    tags_at_pos = tags.get(key, [])
-    slot_name = _ast.GrammarSlotDefinition.get_slot_name(
+                               alternate_tags: dict[int, list[Tag]]):
+    tags_at_pos = alternate_tags.get(absolute_position)
+    if not tags_at_pos:
+        return ()
+    slot_name = definition.get_grammar_slot_name(
         nonterminal.name, alternate_number, absolute_position
     )
     # Checks executed in the pop() function must be offset
     # by one, because of how grammar slots are generated.
-    slot_name_pop = _ast.GrammarSlotDefinition.get_slot_name(
+    slot_name_pop = definition.get_grammar_slot_name(
         nonterminal.name, alternate_number, absolute_position + 1
     )
+    alternative = grammar.rules[nonterminal][alternate_number]
     ambiguity_checks = []
     for tag in tags_at_pos:
         match tag:
@@ -329,7 +362,7 @@ def _generate_ambiguity_checks(definition: _ast.ParserDefinition,
                 ambiguity_checks.append(_ast.Disambiguate(check))
             case ('follow', terminals):
                 literals, ranges = _split_terminals(terminals)
-                symbol_at_pos = grammar.rules[nonterminal][alternate_number][absolute_position]
+                symbol_at_pos = alternative[absolute_position]
                 check_in_pop = not grammar.is_terminal(symbol_at_pos)
                 check = definition.get_and_declare_follow(slot=slot_name,
                                                           literals=literals,
@@ -347,7 +380,7 @@ def _generate_ambiguity_checks(definition: _ast.ParserDefinition,
                     )
             case ('not_follow', terminals):
                 literals, ranges = _split_terminals(terminals)
-                symbol_at_pos = grammar.rules[nonterminal][alternate_number][absolute_position]
+                symbol_at_pos = alternative[absolute_position]
                 check_in_pop = not grammar.is_terminal(symbol_at_pos)
                 check = definition.get_and_declare_not_follow(slot=(slot_name
                                                                     if not check_in_pop
@@ -384,24 +417,28 @@ def _generate_ambiguity_checks(definition: _ast.ParserDefinition,
 
 def _split_terminals(
         terminals: list[_cfg.Terminal]) -> tuple[list[str], tuple[tuple[int, int], ...]]:
+    if not terminals:
+        return [], ()
+    epsilon = _cfg.Terminal.empty()
     literals = []
     ranges = []
     for terminal in terminals:
+        if terminal is epsilon:
+            literals.append('')
+            continue
         match terminal:
             case _cfg.Terminal(ranges=None, sequence=None):
                 literals.append('')
             case _cfg.Terminal(ranges=None, sequence=seq):
                 literals.append(seq)
-            case _cfg.Terminal(ranges=ranges, sequence=None):
-                ranges.append(ranges)
+            case _cfg.Terminal(ranges=terminal_ranges, sequence=None):
+                ranges.extend(terminal_ranges)
             case _:
                 raise ValueError(terminal)
-    utf8_max = 0x10FFFF
-    combined_range = functools.reduce(
-        lambda x, y: x | y,
-        [_int_sets.IntSet(r, (0, utf8_max)) for r in ranges],
-        _int_sets.IntSet.empty_set((0, utf8_max))
-    ).ranges
+    if not ranges:
+        return literals, ()
+    # All ranges are merged in a single pass
+    combined_range = _int_sets.IntSet(ranges, _UNIVERSE).ranges
     return literals, combined_range
 
 
@@ -411,22 +448,17 @@ def _split_terminals(
 ##############################################################################
 
 
-def _test_set_to_checks(
-        definition: _ast.ParserDefinition,
-        test_set: frozenset[_cfg.Terminal]) -> list[str]:
-    return [_terminal_to_check(definition, symbol) for symbol in test_set]
-
-
-def _terminal_to_check(
-        definition: _ast.ParserDefinition,
-        terminal: _cfg.Terminal) -> str:
-    match terminal:
-        case _cfg.Terminal(ranges=None, sequence=None):
-            return definition.get_and_declare_literal_check('')
-        case _cfg.Terminal(ranges=None, sequence=seq):
-            return definition.get_and_declare_literal_check(seq)
-        case _cfg.Terminal(ranges=ranges, sequence=None):
-            return definition.get_and_declare_range_check(ranges)
+def _with_last(iterable: typing.Iterable[_I]) -> typing.Iterator[tuple[_I, bool]]:
+    # Yield (item, is_last) pairs, using one item of lookahead.
+    iterator = iter(iterable)
+    try:
+        previous = next(iterator)
+    except StopIteration:
+        return
+    for item in iterator:
+        yield previous, False
+        previous = item
+    yield previous, True
 
 
 ##############################################################################
@@ -484,15 +516,12 @@ def _generate_ambiguity_check_comment(nonterminal: _cfg.Nonterminal,
                                       check_type: str,
                                       checks: list[_cfg.Terminal],
                                       grammar: _cfg.ContextFreeGrammar):
-    grammar_slot_start = _format_expansion(
-        grammar.rules[nonterminal][alternate][:position]
-    )
-    grammar_slot_end = _format_expansion(
-        grammar.rules[nonterminal][alternate][position:]
-    )
+    alternative = grammar.rules[nonterminal][alternate]
+    grammar_slot_start = _format_expansion(alternative[:position])
+    grammar_slot_end = _format_expansion(alternative[position:])
     grammar_slot = f'|{grammar_slot_start}| . |{grammar_slot_end}|'
     alignment = len(grammar_slot_start) + len('|') + len('| . |')
-    if isinstance(grammar.rules[nonterminal][alternate][position], _cfg.Terminal):
+    if isinstance(alternative[position], _cfg.Terminal):
         alignment += 1  # Adjust for the quote
     return [
         _ast.Comment('Ambiguity check:'),
@@ -5,7 +5,6 @@
 
 from __future__ import annotations
 
-import collections
 import dataclasses
 import enum
 import functools
@@ -85,12 +84,13 @@ class NameMangler:
 
     def __init__(self, prefix: str):
         self.__prefix = prefix
-        self.__names = collections.defaultdict(int)
+        self.__names: dict[str, int] = {}
 
     def mangle(self, *parts: str) -> str:
         base_name = '_'.join(parts)
-        self.__names[base_name] += 1
-        return f'{self.__prefix}_{self.__names[base_name] - 1}_{base_name}'
+        index = self.__names.get(base_name, 0)
+        self.__names[base_name] = index + 1
+        return f'{self.__prefix}_{index}_{base_name}'
 
 
 ##############################################################################
@@ -125,12 +125,12 @@ class AugmentedGrammar:
 ##############################################################################
 
 
-class MappingResult(typing.NamedTuple):
+@dataclasses.dataclass(frozen=True, slots=True)
+class MappingResult:
     mapping: GrammarMapping
     rule: _cfg.Alternative
 
 
-@functools.singledispatch
 def _map_definition_to_cfg(
         symbol: _def.Symbol,
         cfg: _cfg.ContextFreeGrammar) -> MappingResult:
@@ -148,18 +148,30 @@ def _map_definition_to_cfg(
     Note that this function handles converting a single
     _alternate_ to context free grammar form.
 
-    This function returns a tuple. The first element is the
-    datastructure detailing the mapping from CFG to
-    grammar definition. The second element is the
+    This function returns a MappingResult. The `mapping` field is
+    the datastructure detailing the mapping from CFG to
+    grammar definition. The `rule` field is the
     expansion of the alternate, usable for the
     `cfg.add_rule` method.
     """
-    raise ValueError(f'No handler found for symbol type: {symbol.__name__}')
+    symbol_type = type(symbol)
+    handler = _HANDLERS.get(symbol_type)
+    if handler is None:
+        # Other subclasses use the handler of their
+        # closest registered base class.
+        for base in symbol_type.__mro__:
+            if base in _HANDLERS:
+                handler = _HANDLERS[base]
+                break
+        else:
+            raise ValueError(
+                f'No handler found for symbol type: {symbol_type.__name__}'
+            )
+    return handler(symbol, cfg)
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Nonterminal,
-      cfg: _cfg.ContextFreeGrammar) -> MappingResult:
+def _map_nonterminal(symbol: _def.Nonterminal,
+                     cfg: _cfg.ContextFreeGrammar) -> MappingResult:
     return MappingResult(
         mapping=DirectMap(def_node=symbol,
                           cfg_node=_cfg.Nonterminal(symbol.nonterminal)),
@@ -167,24 +179,21 @@ def _(symbol: _def.Nonterminal,
     )
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Parameter, cfg: _cfg.ContextFreeGrammar):
+def _map_parameter(symbol: _def.Parameter, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('Parameter')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Parametrized, cfg: _cfg.ContextFreeGrammar):
+def _map_parametrized(symbol: _def.Parametrized, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('Parameterized')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.LabeledSymbol, cfg: _cfg.ContextFreeGrammar):
+def _map_labeled_symbol(symbol: _def.LabeledSymbol,
+                        cfg: _cfg.ContextFreeGrammar):
     _not_implemented('LabeledSymbol')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Literal,
-      cfg: _cfg.ContextFreeGrammar) -> MappingResult:
+def _map_literal(symbol: _def.Literal,
+                 cfg: _cfg.ContextFreeGrammar) -> MappingResult:
     node = _cfg.Terminal.literal(symbol.text)
     return MappingResult(
         mapping=DirectMap(def_node=symbol, cfg_node=node),
@@ -192,19 +201,11 @@ def _(symbol: _def.Literal,
     )
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.CaseInsensitiveLiteral,
-      cfg: _cfg.ContextFreeGrammar):
-    characters = [(ord(char.lower()), ord(char.upper()))
-                  for char in symbol.text]
+def _map_case_insensitive_literal(symbol: _def.CaseInsensitiveLiteral,
+                                  cfg: _cfg.ContextFreeGrammar):
     terminals = [
-        _cfg.Terminal.character_class(
-            (
-                (lower, lower),
-                (upper, upper)
-            )
-        )
-        for lower, upper in characters
+        _case_insensitive_terminal(ord(char.lower()), ord(char.upper()))
+        for char in symbol.text
     ]
     return MappingResult(
         mapping=SequenceMap(def_node=symbol, cfg_node=terminals),
@@ -212,54 +213,59 @@ def _(symbol: _def.CaseInsensitiveLiteral,
     )
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.StarRepeat, cfg: _cfg.ContextFreeGrammar):
+@functools.cache
+def _case_insensitive_terminal(lower: int, upper: int) -> _cfg.Terminal:
+    # Keywords share most of their characters, so the terminal
+    # for every (lower, upper) pair is only created once.
+    return _cfg.Terminal.character_class(
+        (
+            (lower, lower),
+            (upper, upper)
+        )
+    )
+
+
+def _map_star_repeat(symbol: _def.StarRepeat, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('StarRepeat')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.PlusRepeat, cfg: _cfg.ContextFreeGrammar):
+def _map_plus_repeat(symbol: _def.PlusRepeat, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('PlusRepeat')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.RangeRepeat, cfg: _cfg.ContextFreeGrammar):
+def _map_range_repeat(symbol: _def.RangeRepeat, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('RangeRepeat')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.StarRepeatWithSeparator, cfg: _cfg.ContextFreeGrammar):
+def _map_star_repeat_with_separator(symbol: _def.StarRepeatWithSeparator,
+                                    cfg: _cfg.ContextFreeGrammar):
     _not_implemented('StarRepeatWithSeparator')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.PlusRepeatWithSeparator, cfg: _cfg.ContextFreeGrammar):
+def _map_plus_repeat_with_separator(symbol: _def.PlusRepeatWithSeparator,
+                                    cfg: _cfg.ContextFreeGrammar):
     _not_implemented('PlusRepeatWithSeparator')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.RangeRepeatWithSeparator, cfg: _cfg.ContextFreeGrammar):
+def _map_range_repeat_with_separator(symbol: _def.RangeRepeatWithSeparator,
+                                     cfg: _cfg.ContextFreeGrammar):
     _not_implemented('RangeRepeatWithSeparator')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Optional, cfg: _cfg.ContextFreeGrammar):
+def _map_optional(symbol: _def.Optional, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('Optional')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Alternative, cfg: _cfg.ContextFreeGrammar):
+def _map_alternative(symbol: _def.Alternative, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('Alternative')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Sequence, cfg: _cfg.ContextFreeGrammar):
+def _map_sequence(symbol: _def.Sequence, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('Sequence')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Empty,
-      cfg: _cfg.ContextFreeGrammar) -> MappingResult:
+def _map_empty(symbol: _def.Empty,
+               cfg: _cfg.ContextFreeGrammar) -> MappingResult:
     epsilon = _cfg.Terminal.empty()
     return MappingResult(
         mapping=DirectMap(def_node=symbol, cfg_node=epsilon),
@@ -267,51 +273,79 @@ def _(symbol: _def.Empty,
     )
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.StartOfLine, cfg: _cfg.ContextFreeGrammar):
+def _map_start_of_line(symbol: _def.StartOfLine, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('StartOfLine')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.EndOfLine, cfg: _cfg.ContextFreeGrammar):
+def _map_end_of_line(symbol: _def.EndOfLine, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('EndOfLine')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Except, cfg: _cfg.ContextFreeGrammar):
+def _map_except(symbol: _def.Except, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('Except')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.NotFollow, cfg: _cfg.ContextFreeGrammar):
+def _map_not_follow(symbol: _def.NotFollow, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('NotFollow')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Follow, cfg: _cfg.ContextFreeGrammar):
+def _map_follow(symbol: _def.Follow, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('Follow')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.NotPrecede, cfg: _cfg.ContextFreeGrammar):
+def _map_not_precede(symbol: _def.NotPrecede, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('NotPrecede')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Precede, cfg: _cfg.ContextFreeGrammar):
+def _map_precede(symbol: _def.Precede, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('Precede')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.Restriction, cfg: _cfg.ContextFreeGrammar):
+def _map_restriction(symbol: _def.Restriction, cfg: _cfg.ContextFreeGrammar):
     _not_implemented('Restriction')
 
 
-@_map_definition_to_cfg.register
-def _(symbol: _def.CharacterClass, cfg: _cfg.ContextFreeGrammar):
+def _map_character_class(symbol: _def.CharacterClass,
+                         cfg: _cfg.ContextFreeGrammar):
     _not_implemented('CharacterClass')
 
 
+# Handlers by symbol type. Looking up the handler is a single
+# dictionary lookup, instead of singledispatch's MRO based dispatch.
+_HANDLERS: dict[type, typing.Callable[..., MappingResult]] = {
+    _def.Nonterminal: _map_nonterminal,
+    _def.Parameter: _map_parameter,
+    _def.Parametrized: _map_parametrized,
+    _def.LabeledSymbol: _map_labeled_symbol,
+    _def.Literal: _map_literal,
+    _def.CaseInsensitiveLiteral: _map_case_insensitive_literal,
+    _def.StarRepeat: _map_star_repeat,
+    _def.PlusRepeat: _map_plus_repeat,
+    _def.RangeRepeat: _map_range_repeat,
+    _def.StarRepeatWithSeparator: _map_star_repeat_with_separator,
+    _def.PlusRepeatWithSeparator: _map_plus_repeat_with_separator,
+    _def.RangeRepeatWithSeparator: _map_range_repeat_with_separator,
+    _def.Optional: _map_optional,
+    _def.Alternative: _map_alternative,
+    _def.Sequence: _map_sequence,
+    _def.Empty: _map_empty,
+    _def.StartOfLine: _map_start_of_line,
+    _def.EndOfLine: _map_end_of_line,
+    _def.Except: _map_except,
+    _def.NotFollow: _map_not_follow,
+    _def.Follow: _map_follow,
+    _def.NotPrecede: _map_not_precede,
+    _def.Precede: _map_precede,
+    _def.Restriction: _map_restriction,
+    _def.CharacterClass: _map_character_class,
+    _def.CharacterRange: _map_character_class,
+    _def.CharacterClassComplement: _map_character_class,
+    _def.CharacterClassDifference: _map_character_class,
+    _def.CharacterClassUnion: _map_character_class,
+    _def.CharacterClassIntersection: _map_character_class,
+}
+
+
 def _not_implemented(operation: str):
     raise NotImplementedError(f'Unsupported grammar construct: {operation}')
 
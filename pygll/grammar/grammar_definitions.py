@@ -11,7 +11,7 @@ import enum
 import functools
 import operator
 
-from ...util.algorithms import int_sets as _int_sets
+from ..util.algorithms import int_sets as _int_sets
 
 ##############################################################################
 ##############################################################################
@@ -37,7 +37,7 @@ class GrammarDefinition:
     language: str
     start: str
     layout: Layout
-    rules: list[SyntaxDefinition]
+    rules: dict[str, SyntaxDefinition]
 
 
 ##############################################################################
@@ -53,19 +53,19 @@ class SyntaxDefinition(abc.ABC):
 
 
 class Layout(SyntaxDefinition):
-    pass
+    __slots__ = ()
 
 
 class Keywords(SyntaxDefinition):
-    pass
+    __slots__ = ()
 
 
 class Lexical(SyntaxDefinition):
-    pass
+    __slots__ = ()
 
 
 class Syntax(SyntaxDefinition):
-    pass
+    __slots__ = ()
 
 
 ##############################################################################
@@ -126,9 +126,14 @@ class AssociativityGroup(Production):
 class Choice(Production):
     choices: tuple[tuple[Production, ...], ...]
 
+    @classmethod
+    def single(cls, *alternatives: Production) -> Choice:
+        """A choice consisting of a single priority group."""
+        return cls((alternatives,))
+
 
 class ProductionModifier(abc.ABC):
-    pass
+    __slots__ = ()
 
 
 @dataclasses.dataclass(eq=False, frozen=True, slots=True)
@@ -269,19 +274,19 @@ class _FollowOrPrecede(Symbol, abc.ABC):
 
 
 class Follow(_FollowOrPrecede):
-    pass
+    __slots__ = ()
 
 
 class NotFollow(_FollowOrPrecede):
-    pass
+    __slots__ = ()
 
 
 class Precede(_FollowOrPrecede):
-    pass
+    __slots__ = ()
 
 
 class NotPrecede(_FollowOrPrecede):
-    pass
+    __slots__ = ()
 
 
 @dataclasses.dataclass(eq=False, frozen=True, slots=True)
@@ -290,22 +295,53 @@ class Restriction(Symbol):
     constraint: Symbol
 
 
+@dataclasses.dataclass(eq=False, frozen=True, slots=True)
 class CharacterClass(Symbol, abc.ABC):
 
     UNICODE_MIN = 0
     UNICODE_MAX = 0x10_FF_FF
     UNICODE_RANGE = (UNICODE_MIN, UNICODE_MAX)
 
-    @abc.abstractmethod
+    # Character classes are immutable, so they are resolved only once.
+    _resolved: tuple[tuple[int, int], ...] | None = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+
     def resolve(self) -> tuple[tuple[int, int], ...]:
+        if self._resolved is None:
+            # Resolve the operands bottom up (post-order) using an
+            # explicit stack, so deeply nested classes do not recurse.
+            stack = [self]
+            while stack:
+                node = stack[-1]
+                pending = [operand
+                           for operand in node._operands()
+                           if operand._resolved is None]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                if node._resolved is None:
+                    object.__setattr__(node, '_resolved', node._resolve())
+        return self._resolved
+
+    def _operands(self) -> tuple[CharacterClass, ...]:
+        return ()
+
+    @abc.abstractmethod
+    def _resolve(self) -> tuple[tuple[int, int], ...]:
         pass
 
 
 @dataclasses.dataclass(eq=False, frozen=True, slots=True)
 class CharacterRange(CharacterClass):
     ranges: tuple[tuple[int, int], ...]
+    # Set when ranges is already sorted, disjoint and non-adjacent
+    _canonical: bool = dataclasses.field(default=False, repr=False)
 
-    def resolve(self) -> tuple[tuple[int, int], ...]:
+    def _resolve(self) -> tuple[tuple[int, int], ...]:
+        if self._canonical:
+            return self.ranges
         return _int_sets.IntSet(
             self.ranges,
             self.UNICODE_RANGE
@@ -316,11 +352,11 @@ class CharacterRange(CharacterClass):
 class CharacterClassComplement(CharacterClass):
     cls: CharacterClass
 
-    def resolve(self) -> tuple[tuple[int, int], ...]:
-        return (~_int_sets.IntSet(
-            self.cls.resolve(),
-            self.UNICODE_RANGE
-        )).ranges
+    def _operands(self) -> tuple[CharacterClass, ...]:
+        return self.cls,
+
+    def _resolve(self) -> tuple[tuple[int, int], ...]:
+        return _complement_ranges(self.cls.resolve(), *self.UNICODE_RANGE)
 
 
 @dataclasses.dataclass(eq=False, frozen=True, slots=True)
@@ -328,10 +364,14 @@ class CharacterClassDifference(CharacterClass):
     left: CharacterClass
     right: CharacterClass
 
-    def resolve(self) -> tuple[tuple[int, int], ...]:
-        left = _int_sets.IntSet(self.left.resolve(), self.UNICODE_RANGE)
-        right = _int_sets.IntSet(self.right.resolve(), self.UNICODE_RANGE)
-        return (left - right).ranges
+    def _operands(self) -> tuple[CharacterClass, ...]:
+        return self.left, self.right
+
+    def _resolve(self) -> tuple[tuple[int, int], ...]:
+        return _intersect_ranges(
+            self.left.resolve(),
+            _complement_ranges(self.right.resolve(), *self.UNICODE_RANGE)
+        )
 
 
 @dataclasses.dataclass(eq=False, frozen=True, slots=True)
@@ -339,10 +379,11 @@ class CharacterClassUnion(CharacterClass):
     left: CharacterClass
     right: CharacterClass
 
-    def resolve(self) -> tuple[tuple[int, int], ...]:
-        left = _int_sets.IntSet(self.left.resolve(), self.UNICODE_RANGE)
-        right = _int_sets.IntSet(self.right.resolve(), self.UNICODE_RANGE)
-        return (left | right).ranges
+    def _operands(self) -> tuple[CharacterClass, ...]:
+        return self.left, self.right
+
+    def _resolve(self) -> tuple[tuple[int, int], ...]:
+        return _union_ranges(self.left.resolve(), self.right.resolve())
 
 
 @dataclasses.dataclass(eq=False, frozen=True, slots=True)
@@ -350,7 +391,56 @@ class CharacterClassIntersection(CharacterClass):
     left: CharacterClass
     right: CharacterClass
 
-    def resolve(self) -> tuple[tuple[int, int], ...]:
-        left = _int_sets.IntSet(self.left.resolve(), self.UNICODE_RANGE)
-        right = _int_sets.IntSet(self.right.resolve(), self.UNICODE_RANGE)
-        return (left & right).ranges
+    def _operands(self) -> tuple[CharacterClass, ...]:
+        return self.left, self.right
+
+    def _resolve(self) -> tuple[tuple[int, int], ...]:
+        return _intersect_ranges(self.left.resolve(), self.right.resolve())
+
+
+##############################################################################
+##############################################################################
+# Range Algebra
+##############################################################################
+
+# Resolved ranges are sorted, disjoint, and never adjacent,
+# so the set operations on them are single linear sweeps.
+
+
+def _complement_ranges(ranges: tuple[tuple[int, int], ...],
+                       minimum: int,
+                       maximum: int) -> tuple[tuple[int, int], ...]:
+    gaps = []
+    start = minimum
+    for range_start, range_stop in ranges:
+        if range_start > start:
+            gaps.append((start, range_start - 1))
+        start = range_stop + 1
+    if start <= maximum:
+        gaps.append((start, maximum))
+    return tuple(gaps)
+
+
+def _union_ranges(left: tuple[tuple[int, int], ...],
+                  right: tuple[tuple[int, int], ...]) -> tuple[tuple[int, int], ...]:
+    # Both inputs are sorted; sorting their concatenation is linear
+    return _int_sets.normalize_ranges(left + right)
+
+
+def _intersect_ranges(left: tuple[tuple[int, int], ...],
+                      right: tuple[tuple[int, int], ...]) -> tuple[tuple[int, int], ...]:
+    result = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        left_start, left_stop = left[i]
+        right_start, right_stop = right[j]
+        start = max(left_start, right_start)
+        stop = min(left_stop, right_stop)
+        if start <= stop:
+            result.append((start, stop))
+        # Advance past the range which ends first
+        if left_stop < right_stop:
+            i += 1
+        else:
+            j += 1
+    return tuple(result)
@@ -13,9 +13,11 @@ code in an easy to write manner.
 
 from __future__ import annotations
 
+import functools
 import string
 
 from . import grammar_definitions as _defs
+from ..util.algorithms import int_sets as _int_sets
 
 ##############################################################################
 ##############################################################################
@@ -70,17 +72,29 @@ def _apply_assoc(rules, associativity):
     converted_rules: list[_defs.Production] = []
     for rule in rules:
         rule = _maybe_convert_literal(rule)
-        if isinstance(rule, _defs.Symbol):
-            converted_rules.append(_defs.UnlabeledRule((), rule))
-        elif isinstance(rule, _AltBuilder):
-            converted_rules.append(_defs.UnlabeledRule((), rule.finalize()))
-        elif isinstance(rule, _ProductionBuilder):
-            raise ValueError('Cannot have multiple productions inside assoc.')
-        else:
-            raise ValueError(f'Cannot convert type '
-                             f'{rule.__class__.__name__} to alternate.')
-    return _defs.AssociativityGroup(_defs.AssociativityOptions.Assoc,
-                                    _defs.Choice((tuple(converted_rules),)))
+        convert = _ASSOC_CONVERTERS.get(type(rule))
+        if convert is None:
+            convert = _find_assoc_converter(rule)
+        converted_rules.append(convert(rule))
+    return _defs.AssociativityGroup(associativity,
+                                    _defs.Choice.single(*converted_rules))
+
+
+def _find_assoc_converter(rule):
+    if isinstance(rule, _defs.Symbol):
+        return _symbol_to_alternate
+    elif isinstance(rule, _ProductionBuilder):
+        raise ValueError('Cannot have multiple productions inside assoc.')
+    raise ValueError(f'Cannot convert type '
+                     f'{rule.__class__.__name__} to alternate.')
+
+
+def _symbol_to_alternate(rule: _defs.Symbol) -> _defs.UnlabeledRule:
+    return _defs.UnlabeledRule((), rule)
+
+
+def _builder_to_alternate(rule: _AltBuilder) -> _defs.UnlabeledRule:
+    return _defs.UnlabeledRule((), rule.finalize())
 
 
 def _tag_assoc(rule, tag):
@@ -102,17 +116,17 @@ def lit(x: str):
 
 
 def literal(x: str):
-    return _AltBuilder(_defs.Literal(x))
+    return _AltBuilder(_intern_literal(x))
 
 
 def chars(*pairs: list[str]):
     assert all(len(x) == 2 for x in pairs)
     return _CharClassBuilder(
         _defs.CharacterRange(
-            tuple(
-                (ord(start), ord(stop))
-                for start, stop in pairs
-            )
+            _int_sets.normalize_ranges(
+                [(ord(start), ord(stop)) for start, stop in pairs]
+            ),
+            _canonical=True
         )
     )
 
@@ -147,6 +161,8 @@ def not_followed_by(a, b):
 
 class _ProductionBuilder:
 
+    __slots__ = ('__wrapped', '__info')
+
     def __init__(self, wrapped, **kwargs):
         self.__wrapped = wrapped
         self.__info = kwargs
@@ -161,6 +177,14 @@ class _ProductionBuilder:
 ##############################################################################
 
 
+_RULE_CLASSES: dict[str, type[_defs.SyntaxDefinition]] = {
+    'syntax': _defs.Syntax,
+    'lexical': _defs.Lexical,
+    'keywords': _defs.Keywords,
+    'layout': _defs.Layout,
+}
+
+
 def _rule_factory(rule_type: str,
                   name: str,
                   initial_rules,
@@ -192,6 +216,8 @@ class _RuleBuilder:
     as a starting nonterminal.
     """
 
+    __slots__ = ('__type', '__name', '__rules')
+
     def __init__(self, rule_type: str, name: str, initial_rules=None):
         self.__type = rule_type
         self.__name = name
@@ -202,18 +228,10 @@ class _RuleBuilder:
     def finalize(self) -> _defs.SyntaxDefinition:
         """Retrieve the final grammar rule defined by this builder.
         """
-        prod=_defs.Choice((tuple(self.__rules),))
-        match self.__type:
-            case 'syntax':
-                return _defs.Syntax(self.__name, prod)
-            case 'lexical':
-                return _defs.Lexical(self.__name, prod)
-            case 'keywords':
-                return _defs.Keywords(self.__name, prod)
-            case 'layout':
-                return _defs.Layout(self.__name, prod)
-            case _:
-                raise ValueError(self.__type)
+        cls = _RULE_CLASSES.get(self.__type)
+        if cls is None:
+            raise ValueError(self.__type)
+        return cls(self.__name, _defs.Choice.single(*self.__rules))
 
     def make_grammar(self, language: str, *nonterminals: _RuleBuilder, layout=None):
         """Make a grammar, with the current nonterminal as the starting nonterminal.
@@ -236,8 +254,7 @@ class _RuleBuilder:
 
     @property
     def _default_layout(self):
-        layout = lexical('layout', *string.whitespace)
-        return layout.finalize()
+        return _default_layout()
     
     def __ior__(self, other):
         """Add another alternate to this rule.
@@ -250,24 +267,26 @@ class _RuleBuilder:
             - Any type _maybe_convert_literal knows about (i.e. str)
         """
         other = _maybe_convert_literal(other)
-        if isinstance(other, _AltBuilder):
-            rule = _defs.UnlabeledRule((), other.finalize())
-            self.__rules.append(rule)
-            return self
-        if isinstance(other, _CharClassBuilder):
-            rule = _defs.UnlabeledRule((), other.finalize())
-            self.__rules.append(rule)
-            return rule 
-        if isinstance(other, (_defs.UnlabeledRule, _defs.LabeledRule)):
-            self.__rules.append(other)
-            return self 
-        return NotImplemented
+        handler = _IOR_HANDLERS.get(type(other))
+        if handler is None:
+            return NotImplemented
+        handler(self, other)
+        return self
+
+    def _append_builder(self, other: _AltBuilder | _CharClassBuilder):
+        self.__rules.append(_defs.UnlabeledRule((), other.finalize()))
+
+    def _append_symbol(self, other: _defs.Symbol):
+        self.__rules.append(_defs.UnlabeledRule((), other))
+
+    def _append_rule(self, other: _defs.UnlabeledRule | _defs.LabeledRule):
+        self.__rules.append(other)
 
     @property
     def ref(self):
         """Use this function when referring to this rule in an alternate.
         """
-        return _AltBuilder(_defs.Nonterminal(self.__name)) 
+        return _AltBuilder(_intern_nonterminal(self.__name))
 
 
 ##############################################################################
@@ -280,10 +299,22 @@ class _AltBuilder:
     """This class is a builder for single alternates in rules.
     """
 
-    def __init__(self, definition):
+    __slots__ = ('__def', '__pending')
+
+    def __init__(self, definition, pending=None):
+        # Chains of + or | are collected in a list, which is only
+        # turned into a Sequence or Alternative when finalized.
+        # pending is a (class, items, length) triple; items may be
+        # shared with other builders, which extend it in place as
+        # long as they own its tail. The items of this builder are
+        # items[:length].
         self.__def = definition
+        self.__pending = pending
 
     def finalize(self) -> _defs.Symbol:
+        if self.__def is None:
+            cls, items, length = self.__pending
+            self.__def = cls(tuple(items[:length]))
         return self.__def
     
     def __getitem__(self, index):
@@ -301,34 +332,35 @@ class _AltBuilder:
         The separator must either be an _xxxBuilder type,
         or a type compatible with _maybe_convert_literal.
         """
+        definition = self.finalize()
         if isinstance(index, int):
-            return _AltBuilder(_defs.Sequence((self.__def,) * index))
+            return _AltBuilder(_defs.Sequence((definition,) * index))
         assert isinstance(index, slice)
         start, stop = index.start, index.stop
         sep = _maybe_convert_literal(index.step)
         sep = _maybe_finalize(sep)
         if start is None and stop is None:
             if sep is None:
-                return _AltBuilder(_defs.StarRepeat(self.__def))
+                return _AltBuilder(_defs.StarRepeat(definition))
             return _AltBuilder(
-                _defs.StarRepeatWithSeparator(self.__def, sep)
+                _defs.StarRepeatWithSeparator(definition, sep)
             )
         elif start == 1 and stop is None:
             if sep is None:
-                return _AltBuilder(_defs.PlusRepeat(self.__def))
+                return _AltBuilder(_defs.PlusRepeat(definition))
             return _AltBuilder(
-                _defs.PlusRepeatWithSeparator(self.__def, sep)
+                _defs.PlusRepeatWithSeparator(definition, sep)
             )
         elif start is None and stop == 1:
             assert sep is None
-            return _AltBuilder(_defs.Optional(self.__def))
+            return _AltBuilder(_defs.Optional(definition))
         else:
             if sep is None:
                 return _AltBuilder(
-                    _defs.RangeRepeat(self.__def, start, stop)
+                    _defs.RangeRepeat(definition, start, stop)
                 )
             return _AltBuilder(
-                _defs.RangeRepeatWithSeparator(self.__def, sep, start, stop)
+                _defs.RangeRepeatWithSeparator(definition, sep, start, stop)
             )
 
     def __generic_operator(self, other, cls):
@@ -342,9 +374,21 @@ class _AltBuilder:
         return NotImplemented
 
     def __maybe_combine(self, cls, other):
-        if isinstance(self.__def, cls):
-            return _AltBuilder(cls(self.__def.items + (other,)))
-        return _AltBuilder(cls((self.__def, other)))
+        if self.__pending is not None and self.__pending[0] is cls:
+            _, items, length = self.__pending
+            if len(items) != length:
+                # Another builder already extended the list
+                items = items[:length]
+        else:
+            definition = self.finalize()
+            if isinstance(definition, _defs.Sequence) and cls is _defs.Sequence:
+                items = list(definition.items)
+            elif isinstance(definition, _defs.Alternative) and cls is _defs.Alternative:
+                items = list(definition.alternatives)
+            else:
+                items = [definition]
+        items.append(other)
+        return _AltBuilder(None, (cls, items, len(items)))
 
     def __generic_reverse_operator(self, other, op):
         other = _maybe_convert_literal(other)
@@ -375,7 +419,7 @@ class _AltBuilder:
         """
         if not isinstance(other, str):
             return NotImplemented
-        return _AltBuilder(_defs.LabeledSymbol(name=other, symbol=self.__def))
+        return _AltBuilder(_defs.LabeledSymbol(name=other, symbol=self.finalize()))
 
     def __lshift__(self, other):
         if not isinstance(other, _AltBuilder):
@@ -407,6 +451,8 @@ class _AltBuilder:
 
 class _CharClassBuilder:
 
+    __slots__ = ('__cls',)
+
     def __init__(self, inner):
         self.__cls = inner
 
@@ -453,6 +499,27 @@ class _CharClassBuilder:
 
     def cast(self):
         return _AltBuilder(self.finalize())
+
+
+# Handlers for the types which can be added to a rule using |=
+_IOR_HANDLERS = {
+    _AltBuilder: _RuleBuilder._append_builder,
+    _CharClassBuilder: _RuleBuilder._append_builder,
+    # Results of _maybe_convert_literal
+    _defs.Literal: _RuleBuilder._append_symbol,
+    _defs.Empty: _RuleBuilder._append_symbol,
+    _defs.UnlabeledRule: _RuleBuilder._append_rule,
+    _defs.LabeledRule: _RuleBuilder._append_rule,
+}
+
+
+# Converters for the alternates of an associativity group;
+# other types are resolved by _find_assoc_converter.
+_ASSOC_CONVERTERS = {
+    _AltBuilder: _builder_to_alternate,
+    _defs.Literal: _symbol_to_alternate,
+    _defs.Empty: _symbol_to_alternate,
+}
     
 
 ##############################################################################
@@ -462,21 +529,60 @@ class _CharClassBuilder:
 
 
 def _maybe_convert_literal(x):
-    if isinstance(x, str):
+    # Called for every operator; exact type checks are cheapest
+    kind = type(x)
+    if kind is str:
         if not x:
-            return _defs.Empty()
-        return _defs.Literal(x)
-    if isinstance(x, tuple) and x == ():
-        return _defs.Empty()
+            return _EMPTY
+        return _intern_literal(x)
+    if kind is tuple and not x:
+        return _EMPTY
     return x
 
 
+# Grammars refer to the same literals and nonterminals many
+# times; symbols are immutable, so equal ones are shared.
+
+_EMPTY = _defs.Empty()
+
+
+@functools.cache
+def _intern_literal(text: str) -> _defs.Literal:
+    return _defs.Literal(text)
+
+
+@functools.cache
+def _intern_nonterminal(name: str) -> _defs.Nonterminal:
+    return _defs.Nonterminal(name)
+
+
 def _maybe_finalize(x):
     if isinstance(x, _AltBuilder):
         return x.finalize()
     return x
 
 
+@functools.cache
+def _default_layout() -> _defs.SyntaxDefinition:
+    # Definitions are immutable, so all grammars share one layout.
+    # The whitespace characters are merged into a single character
+    # range instead of one literal alternative per character.
+    return _defs.Lexical(
+        'layout',
+        _defs.Choice.single(
+            _defs.UnlabeledRule(
+                (),
+                _defs.CharacterRange(
+                    _int_sets.normalize_ranges(
+                        [(ord(c), ord(c)) for c in string.whitespace]
+                    ),
+                    _canonical=True
+                )
+            )
+        )
+    )
+
+
 ##############################################################################
 ##############################################################################
 # Testing Code
@@ -1,87 +1,107 @@
+import functools
+
 from .grammar_definitions import *
 
 
+# Structurally identical ranges and nonterminals share one instance,
+# so e.g. a range is only resolved once.
+@functools.cache
+def _CR(ranges: tuple[tuple[int, int], ...]) -> CharacterRange:
+    return CharacterRange(ranges)
+
+
+@functools.cache
+def _NT(name: str) -> Nonterminal:
+    return Nonterminal(name)
+
+
+# Character ranges which occur in many rules are only built once
+_HEX_DIGITS = (
+    (ord('0'), ord('9')),
+    (ord('a'), ord('f')),
+    (ord('A'), ord('F')),
+)
+_WORD_CHARACTERS = (
+    (ord('0'), ord('9')),
+    (ord('a'), ord('z')),
+    (ord('A'), ord('Z')),
+    (ord('_'), ord('_'))
+)
+
+
 syntax_definitions = Syntax(
     name='SyntaxDefinitions',
     production=LabeledRule(
         (),
-        StarRepeat(Nonterminal('SyntaxDefinition')),
+        StarRepeat(_NT('SyntaxDefinition')),
         'definitions'
     )
 )
 
 syntax_definition = Syntax(
     name='SyntaxDefinition',
-    production=Choice(
-        (
-            (
-                LabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('layout'),
-                            LabeledSymbol('defined', Nonterminal('Sym')),
-                            Literal('='),
-                            LabeledSymbol('production', Nonterminal('Prod')),
-                            Literal(';')
-                        )
-                    ),
-                    'layout'
-                ),
-                LabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('lexical'),
-                            LabeledSymbol('defined', Nonterminal('Sym')),
-                            Literal('='),
-                            LabeledSymbol('production', Nonterminal('Prod')),
-                            Literal(';')
-                        )
-                    ),
-                    'lexical'
-                ),
-                LabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('keyword'),
-                            LabeledSymbol('defined', Nonterminal('Sym')),
-                            Literal('='),
-                            LabeledSymbol('production', Nonterminal('Prod')),
-                            Literal(';')
-                        )
-                    ),
-                    'keyword'
-                ),
-                LabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            LabeledSymbol('start', Nonterminal('Start')),
-                            Literal('syntax'),
-                            LabeledSymbol('defined', Nonterminal('Sym')),
-                            Literal('='),
-                            LabeledSymbol('production', Nonterminal('Prod')),
-                            Literal(';')
-                        )
-                    ),
-                    'syntax'
-                ),
+    production=Choice.single(
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('layout'),
+                    LabeledSymbol('defined', _NT('Sym')),
+                    Literal('='),
+                    LabeledSymbol('production', _NT('Prod')),
+                    Literal(';')
+                )
+            ),
+            'layout'
+        ),
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('lexical'),
+                    LabeledSymbol('defined', _NT('Sym')),
+                    Literal('='),
+                    LabeledSymbol('production', _NT('Prod')),
+                    Literal(';')
+                )
+            ),
+            'lexical'
+        ),
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('keyword'),
+                    LabeledSymbol('defined', _NT('Sym')),
+                    Literal('='),
+                    LabeledSymbol('production', _NT('Prod')),
+                    Literal(';')
+                )
             ),
+            'keyword'
+        ),
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    LabeledSymbol('start', _NT('Start')),
+                    Literal('syntax'),
+                    LabeledSymbol('defined', _NT('Sym')),
+                    Literal('='),
+                    LabeledSymbol('production', _NT('Prod')),
+                    Literal(';')
+                )
+            ),
+            'syntax'
         )
     )
 )
 
 start = Syntax(
     name='Start',
-    production=Choice(
-        (   # outer tuple
-            (   # inner tuple
-                LabeledRule((), Empty(), 'absent'),
-                LabeledRule((), Literal('start'), 'present')
-            ),
-        )
+    production=Choice.single(
+        LabeledRule((), Empty(), 'absent'),
+        LabeledRule((), Literal('start'), 'present')
     )
 )
 
@@ -93,21 +113,16 @@ octal_literal = Lexical(
             Sequence(
                 (
                     Literal('0'),
-                    CharacterRange((
+                    _CR((
                         (ord('o'), ord('o')),
                         (ord('O'), ord('O'))
                     )),
                     PlusRepeat(
-                        CharacterRange(((ord('0'), ord('7')),)),
+                        _CR(((ord('0'), ord('7')),)),
                     ),
                 )
             ),
-            CharacterRange((
-                (ord('0'), ord('9')),
-                (ord('a'), ord('z')),
-                (ord('A'), ord('Z')),
-                (ord('_'), ord('_'))
-            ))
+            _CR(_WORD_CHARACTERS)
         )
     )
 )
@@ -120,205 +135,129 @@ hex_literal = Lexical(
             Sequence(
                 (
                    Literal('0'),
-                    CharacterRange((
+                    _CR((
                         (ord('x'), ord('x')),
                         (ord('X'), ord('X'))
                     )),
                     PlusRepeat(
-                        CharacterRange((
-                            (ord('0'), ord('9')),
-                            (ord('a'), ord('f')),
-                            (ord('A'), ord('F')),
-                        )),
+                        _CR(_HEX_DIGITS),
                     ),
                 )
             ),
-            CharacterRange((
-                (ord('0'), ord('9')),
-                (ord('a'), ord('z')),
-                (ord('A'), ord('Z')),
-                (ord('_'), ord('_'))
-            ))
+            _CR(_WORD_CHARACTERS)
         )
     )
 )
 
 decimal_literal = Lexical(
     name='DecimalIntegerLiteral',
-    production=Choice(
-        (
-            (
-                UnlabeledRule(
-                    (),
-                    NotFollow(
-                        Sequence(
-                            (
-                                CharacterRange((
-                                    (ord('1'), ord('9')),
-                                )),
-                                StarRepeat(
-                                    CharacterRange(((ord('0'), ord('9')),)),
-                                ),
-                            )
+    production=Choice.single(
+        UnlabeledRule(
+            (),
+            NotFollow(
+                Sequence(
+                    (
+                        _CR((
+                            (ord('1'), ord('9')),
+                        )),
+                        StarRepeat(
+                            _CR(((ord('0'), ord('9')),)),
                         ),
-                        CharacterRange((
-                            (ord('0'), ord('9')),
-                            (ord('a'), ord('z')),
-                            (ord('A'), ord('Z')),
-                            (ord('_'), ord('_'))
-                        ))
                     )
                 ),
-                UnlabeledRule(
-                    (),
-                    NotFollow(
-                        Literal('0'),
-                        CharacterRange((
-                            (ord('0'), ord('9')),
-                            (ord('a'), ord('z')),
-                            (ord('A'), ord('Z')),
-                            (ord('_'), ord('_'))
-                        ))
-                    )
-                )
-            ),
+                _CR(_WORD_CHARACTERS)
+            )
         ),
+        UnlabeledRule(
+            (),
+            NotFollow(
+                Literal('0'),
+                _CR(_WORD_CHARACTERS)
+            )
+        )
     )
 )
 
 integer_literal = Syntax(
     name='IntegerLiteral',
-    production=Choice
-    (
-        (
-            (
-                LabeledRule(
-                    (),
-                    LabeledSymbol('decimal', Nonterminal('DecimalIntegerLiteral')),
-                    'decimalIntegerLiteral'),
-                LabeledRule(
-                    (),
-                    LabeledSymbol('hex', Nonterminal('HexIntegerLiteral')),
-                    'hexIntegerLiteral'),
-                LabeledRule(
-                    (),
-                    LabeledSymbol('octal', Nonterminal('OctalIntegerLiteral')),
-                    'octalIntegerLiteral'),
-            ),
-        )
+    production=Choice.single(
+        LabeledRule(
+            (),
+            LabeledSymbol('decimal', _NT('DecimalIntegerLiteral')),
+            'decimalIntegerLiteral'),
+        LabeledRule(
+            (),
+            LabeledSymbol('hex', _NT('HexIntegerLiteral')),
+            'hexIntegerLiteral'),
+        LabeledRule(
+            (),
+            LabeledSymbol('octal', _NT('OctalIntegerLiteral')),
+            'octalIntegerLiteral')
     )
 )
 
 assoc = Syntax(
     name='Assoc',
-    production=Choice(
-        (
-            (
-                LabeledRule((), Literal('assoc'), 'associative'),
-                LabeledRule((), Literal('left'), 'left'),
-                LabeledRule((), Literal('non-assoc'), 'nonAssociative'),
-                LabeledRule((), Literal('right'), 'right'),
-            ),
-        )
+    production=Choice.single(
+        LabeledRule((), Literal('assoc'), 'associative'),
+        LabeledRule((), Literal('left'), 'left'),
+        LabeledRule((), Literal('non-assoc'), 'nonAssociative'),
+        LabeledRule((), Literal('right'), 'right')
     )
 )
 
 unicode_escape = Syntax(
     name='UnicodeEscape',
-    production=Choice(
-        (
-            (
-                LabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('\\u'),
-                            CharacterRange((
-                                (ord('0'), ord('9')),
-                                (ord('a'), ord('f')),
-                                (ord('A'), ord('F')),
-                            )),
-                            CharacterRange((
-                                (ord('0'), ord('9')),
-                                (ord('a'), ord('f')),
-                                (ord('A'), ord('F')),
-                            )),
-                            CharacterRange((
-                                (ord('0'), ord('9')),
-                                (ord('a'), ord('f')),
-                                (ord('A'), ord('F')),
-                            )),
-                            CharacterRange((
-                                (ord('0'), ord('9')),
-                                (ord('a'), ord('f')),
-                                (ord('A'), ord('F')),
-                            ))
-                        )
-                    ),
-                    'utf16'
-                ),
-                LabeledRule(
-                    (),
-                    Sequence(
+    production=Choice.single(
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('\\u'),
+                    _CR(_HEX_DIGITS),
+                    _CR(_HEX_DIGITS),
+                    _CR(_HEX_DIGITS),
+                    _CR(_HEX_DIGITS)
+                )
+            ),
+            'utf16'
+        ),
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('\\U'),
+                    Alternative(
                         (
-                            Literal('\\U'),
-                            Alternative(
+                            Literal('10'),
+                            Sequence(
                                 (
-                                    Literal('10'),
-                                    Sequence(
-                                        (
-                                            Literal('0'),
-                                            CharacterRange((
-                                                (ord('0'), ord('9')),
-                                                (ord('a'), ord('f')),
-                                                (ord('A'), ord('F')),
-                                            )),
-                                        )
-                                    )
+                                    Literal('0'),
+                                    _CR(_HEX_DIGITS),
                                 )
-                            ),
-                            CharacterRange((
-                                (ord('0'), ord('9')),
-                                (ord('a'), ord('f')),
-                                (ord('A'), ord('F')),
-                            )),
-                            CharacterRange((
-                                (ord('0'), ord('9')),
-                                (ord('a'), ord('f')),
-                                (ord('A'), ord('F')),
-                            )),
-                            CharacterRange((
-                                (ord('0'), ord('9')),
-                                (ord('a'), ord('f')),
-                                (ord('A'), ord('F')),
-                            )),
-                            CharacterRange((
-                                (ord('0'), ord('9')),
-                                (ord('a'), ord('f')),
-                                (ord('A'), ord('F')),
-                            ))
-                        )
-                    ),
-                    'utf32'
-                ),
-                LabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('\\a'),
-                            CharacterRange((
-                                (ord('0'), ord('7')),
-                            )),
-                            CharacterRange((
-                                (ord('0'), ord('9')),
-                                (ord('a'), ord('f')),
-                                (ord('A'), ord('F')),
-                            ))
+                            )
                         )
                     ),
-                    'ascii'
-                ),
+                    _CR(_HEX_DIGITS),
+                    _CR(_HEX_DIGITS),
+                    _CR(_HEX_DIGITS),
+                    _CR(_HEX_DIGITS)
+                )
+            ),
+            'utf32'
+        ),
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('\\a'),
+                    _CR((
+                        (ord('0'), ord('7')),
+                    )),
+                    _CR(_HEX_DIGITS)
+                )
             ),
+            'ascii'
         )
     )
 )
@@ -331,7 +270,7 @@ name = Lexical(
             symbol=NotFollow(
                 symbol=Sequence(
                     (
-                        CharacterRange(
+                        _CR(
                             (
                                 (ord('a'), ord('z')),
                                 (ord('A'), ord('Z')),
@@ -339,34 +278,13 @@ name = Lexical(
                             )
                         ),
                         StarRepeat(
-                            CharacterRange(
-                                (
-                                    (ord('0'), ord('9')),
-                                    (ord('a'), ord('z')),
-                                    (ord('A'), ord('Z')),
-                                    (ord('_'), ord('_')),
-                                )
-                            )
+                            _CR(_WORD_CHARACTERS)
                         )
                     )
                 ),
-                constraint=CharacterRange(
-                    (
-                        (ord('0'), ord('9')),
-                        (ord('a'), ord('z')),
-                        (ord('A'), ord('Z')),
-                        (ord('_'), ord('_')),
-                    )
-                )
+                constraint=_CR(_WORD_CHARACTERS)
             ),
-            constraint=CharacterRange(
-                (
-                    (ord('0'), ord('9')),
-                    (ord('a'), ord('z')),
-                    (ord('A'), ord('Z')),
-                    (ord('_'), ord('_')),
-                )
-            )
+            constraint=_CR(_WORD_CHARACTERS)
         )
     )
 )
@@ -378,69 +296,55 @@ nonterminal_label = Lexical(
         NotFollow(
             symbol=Sequence(
                 (
-                    CharacterRange((
+                    _CR((
                         (ord('a'), ord('z')),
                     )),
-                    CharacterRange((
-                        (ord('0'), ord('9')),
-                        (ord('a'), ord('z')),
-                        (ord('A'), ord('Z')),
-                        (ord('_'), ord('_')),
-                    ))
+                    _CR(_WORD_CHARACTERS)
                 )
             ),
-            constraint=CharacterRange((
-                (ord('0'), ord('9')),
-                (ord('a'), ord('z')),
-                (ord('A'), ord('Z')),
-                (ord('_'), ord('_')),
-            ))
+            constraint=_CR(_WORD_CHARACTERS)
         )
     )
 )
 
 string_character = Lexical(
     name='StringCharacter',
-    production=Choice(
-        (
-            (
-                UnlabeledRule(
-                    (),
-                    Nonterminal('UnicodeEscape')
-                ),
-                UnlabeledRule(
-                    (),
-                    CharacterClassComplement(
-                        CharacterRange((
-                            (ord('"'), ord('"')),
-                            (ord("'"), ord("'")),
-                            (ord('<'), ord('>')),
-                            (ord('>'), ord('>')),
-                            (ord('\\'), ord('\\')),
-                        ))
-                    )
-                ),
-                UnlabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('\\'),
-                            CharacterRange((
-                                (ord('"'), ord('"')),
-                                (ord("'"), ord("'")),
-                                (ord('<'), ord('>')),
-                                (ord('>'), ord('>')),
-                                (ord('\\'), ord('\\')),
-                                (ord('b'), ord('b')),
-                                (ord('f'), ord('f')),
-                                (ord('n'), ord('n')),
-                                (ord('r'), ord('r')),
-                                (ord('t'), ord('t')),
-                            ))
-                        )
-                    )
+    production=Choice.single(
+        UnlabeledRule(
+            (),
+            _NT('UnicodeEscape')
+        ),
+        UnlabeledRule(
+            (),
+            CharacterClassComplement(
+                _CR((
+                    (ord('"'), ord('"')),
+                    (ord("'"), ord("'")),
+                    (ord('<'), ord('>')),
+                    (ord('>'), ord('>')),
+                    (ord('\\'), ord('\\')),
+                ))
+            )
+        ),
+        UnlabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('\\'),
+                    _CR((
+                        (ord('"'), ord('"')),
+                        (ord("'"), ord("'")),
+                        (ord('<'), ord('>')),
+                        (ord('>'), ord('>')),
+                        (ord('\\'), ord('\\')),
+                        (ord('b'), ord('b')),
+                        (ord('f'), ord('f')),
+                        (ord('n'), ord('n')),
+                        (ord('r'), ord('r')),
+                        (ord('t'), ord('t')),
+                    ))
                 )
-            ),
+            )
         )
     )
 )
@@ -455,7 +359,7 @@ case_insensitive_string_constant = Lexical(
                 LabeledSymbol(
                     'chars',
                     StarRepeat(
-                        Nonterminal('StringCharacter')
+                        _NT('StringCharacter')
                     )
                 ),
                 Literal("'")
@@ -474,7 +378,7 @@ string_constant = Lexical(
                 LabeledSymbol(
                     'chars',
                     StarRepeat(
-                        Nonterminal('StringCharacter')
+                        _NT('StringCharacter')
                     )
                 ),
                 Literal('"')
@@ -492,11 +396,11 @@ nonterminal = Lexical(
                 symbol=NotPrecede(
                     symbol=Sequence(
                         (
-                            CharacterRange((
+                            _CR((
                                 (ord('A'), ord('Z')),
                             )),
                             StarRepeat(
-                                CharacterRange((
+                                _CR((
                                     (ord('A'), ord('Z')),
                                     (ord('a'), ord('z')),
                                     (ord('0'), ord('9')),
@@ -505,67 +409,59 @@ nonterminal = Lexical(
                             )
                         )
                     ),
-                    constraint=CharacterRange((
+                    constraint=_CR((
                         (ord('A'), ord('Z')),
                     )),
                 ),
-                constraint=CharacterRange((
+                constraint=_CR((
                     (ord('A'), ord('Z')),
                     (ord('a'), ord('z')),
                     (ord('0'), ord('9')),
                     (ord('_'), ord('_')),
                 )),
             ),
-            constraint=Nonterminal('SyntaxKeywords')
+            constraint=_NT('SyntaxKeywords')
         )
     )
 )
 
 syntax_keywords = Keywords(
     name='SyntaxKeywords',
-    production=Choice(
-        (
-            (
-                UnlabeledRule((), Literal('syntax')),
-                UnlabeledRule((), Literal('start')),
-                UnlabeledRule((), Literal('layout')),
-                UnlabeledRule((), Literal('lexical')),
-                UnlabeledRule((), Literal('assoc')),
-                UnlabeledRule((), Literal('non-assoc')),
-                UnlabeledRule((), Literal('left')),
-                UnlabeledRule((), Literal('right')),
-            ),
-        )
+    production=Choice.single(
+        UnlabeledRule((), Literal('syntax')),
+        UnlabeledRule((), Literal('start')),
+        UnlabeledRule((), Literal('layout')),
+        UnlabeledRule((), Literal('lexical')),
+        UnlabeledRule((), Literal('assoc')),
+        UnlabeledRule((), Literal('non-assoc')),
+        UnlabeledRule((), Literal('left')),
+        UnlabeledRule((), Literal('right'))
     )
 )
 
 tag = Syntax(
     name='Tag',
-    production=Choice(
-        (
-            (
-                LabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('@'),
-                            LabeledSymbol('name', Nonterminal('Name')),
-                            LabeledSymbol('contents', Nonterminal('TagString'))
-                        )
-                    ),
-                    'default'
-                ),
-                LabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('@'),
-                            LabeledSymbol('name', Nonterminal('Name')),
-                        )
-                    ),
-                    'empty'
+    production=Choice.single(
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('@'),
+                    LabeledSymbol('name', _NT('Name')),
+                    LabeledSymbol('contents', _NT('TagString'))
+                )
+            ),
+            'default'
+        ),
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('@'),
+                    LabeledSymbol('name', _NT('Name')),
                 )
             ),
+            'empty'
         )
     )
 )
@@ -586,7 +482,7 @@ tag_string = Lexical(
                         Alternative(
                             (
                                 CharacterClassComplement(
-                                    CharacterRange((
+                                    _CR((
                                         (ord('{'), ord('{')),
                                         (ord('}'), ord('}')),
                                     ))
@@ -594,13 +490,13 @@ tag_string = Lexical(
                                 Sequence(
                                     (
                                         Literal('\\'),
-                                        CharacterRange((
+                                        _CR((
                                             (ord('{'), ord('{')),
                                             (ord('}'), ord('}')),
                                         ))
                                     )
                                 ),
-                                Nonterminal('TagString')
+                                _NT('TagString')
                             )
                         )
                     )
@@ -616,21 +512,17 @@ tag_string = Lexical(
 
 prod_modifier = Syntax(
     name='ProdModifier',
-    production=Choice(
-        (
-            (
-                LabeledRule(
-                    (),
-                    LabeledSymbol('associativity', Nonterminal('Assoc')),
-                    'associativity'
-                ),
-                LabeledRule((), Literal('bracket'), 'bracket'),
-                LabeledRule(
-                    (),
-                    LabeledSymbol('tag', Nonterminal('Tag')),
-                    'tag'
-                ),
-            ),
+    production=Choice.single(
+        LabeledRule(
+            (),
+            LabeledSymbol('associativity', _NT('Assoc')),
+            'associativity'
+        ),
+        LabeledRule((), Literal('bracket'), 'bracket'),
+        LabeledRule(
+            (),
+            LabeledSymbol('tag', _NT('Tag')),
+            'tag'
         )
     )
 )
@@ -645,7 +537,7 @@ prod = Syntax(
                     Sequence(
                         (
                             Literal(':'),
-                            LabeledSymbol('referenced', Nonterminal('Name'))
+                            LabeledSymbol('referenced', _NT('Name'))
                         )
                     ),
                     'reference'
@@ -657,15 +549,15 @@ prod = Syntax(
                             LabeledSymbol(
                                 'modifiers',
                                 StarRepeat(
-                                    Nonterminal('ProdModifier')
+                                    _NT('ProdModifier')
                                 )
                             ),
-                            LabeledSymbol('name', Nonterminal('Name')),
+                            LabeledSymbol('name', _NT('Name')),
                             Literal(':'),
                             LabeledSymbol(
                                 'syms',
                                 StarRepeat(
-                                    Nonterminal('Sym')
+                                    _NT('Sym')
                                 )
                             )
                         )
@@ -679,13 +571,13 @@ prod = Syntax(
                             LabeledSymbol(
                                 'modifiers',
                                 StarRepeat(
-                                    Nonterminal('ProdModifier')
+                                    _NT('ProdModifier')
                                 )
                             ),
                             LabeledSymbol(
                                 'syms',
                                 StarRepeat(
-                                    Nonterminal('Sym')
+                                    _NT('Sym')
                                 )
                             )
                         )
@@ -698,10 +590,10 @@ prod = Syntax(
                         (
                             LabeledSymbol(
                                 'associativity',
-                                Nonterminal('Assoc')
+                                _NT('Assoc')
                             ),
                             Literal('('),
-                            LabeledSymbol('group', Nonterminal('Prod')),
+                            LabeledSymbol('group', _NT('Prod')),
                             Literal(')')
                         )
                     ),
@@ -715,9 +607,9 @@ prod = Syntax(
                     ),
                     Sequence(
                         (
-                            LabeledSymbol('lhs', Nonterminal('Prod')),
+                            LabeledSymbol('lhs', _NT('Prod')),
                             Literal('|'),
-                            LabeledSymbol('rhs', Nonterminal('Prod'))
+                            LabeledSymbol('rhs', _NT('Prod'))
                         )
                     ),
                     'all'
@@ -730,12 +622,12 @@ prod = Syntax(
                     ),
                     Sequence(
                         (
-                            LabeledSymbol('lhs', Nonterminal('Prod')),
+                            LabeledSymbol('lhs', _NT('Prod')),
                             NotFollow(
                                 symbol=Literal('>'),
                                 constraint=Literal('>')
                             ),
-                            LabeledSymbol('rhs', Nonterminal('Prod'))
+                            LabeledSymbol('rhs', _NT('Prod'))
                         )
                     ),
                     'first'
@@ -758,7 +650,7 @@ char_class = Syntax(
                             Literal('['),
                             LabeledSymbol(
                                 'ranges',
-                                StarRepeat(Nonterminal('Range'))
+                                StarRepeat(_NT('Range'))
                             ),
                             Literal(']')
                         )
@@ -770,7 +662,7 @@ char_class = Syntax(
                     Sequence(
                         (
                             Literal('!'),
-                            LabeledSymbol('charClass', Nonterminal('Class'))
+                            LabeledSymbol('charClass', _NT('Class'))
                         )
                     ),
                     'complement'
@@ -783,9 +675,9 @@ char_class = Syntax(
                     ),
                     Sequence(
                         (
-                            LabeledSymbol('lhs', Nonterminal('Class')),
+                            LabeledSymbol('lhs', _NT('Class')),
                             Literal('-'),
-                            LabeledSymbol('rhs', Nonterminal('Class'))
+                            LabeledSymbol('rhs', _NT('Class'))
                         )
                     ),
                     'difference'
@@ -798,9 +690,9 @@ char_class = Syntax(
                     ),
                     Sequence(
                         (
-                            LabeledSymbol('lhs', Nonterminal('Class')),
+                            LabeledSymbol('lhs', _NT('Class')),
                             Literal('&&'),
-                            LabeledSymbol('rhs', Nonterminal('Class'))
+                            LabeledSymbol('rhs', _NT('Class'))
                         )
                     ),
                     'intersection'
@@ -813,9 +705,9 @@ char_class = Syntax(
                     ),
                     Sequence(
                         (
-                            LabeledSymbol('lhs', Nonterminal('Class')),
+                            LabeledSymbol('lhs', _NT('Class')),
                             Literal('||'),
-                            LabeledSymbol('rhs', Nonterminal('Class'))
+                            LabeledSymbol('rhs', _NT('Class'))
                         )
                     ),
                     'union'
@@ -827,7 +719,7 @@ char_class = Syntax(
                     Sequence(
                         (
                             Literal('('),
-                            LabeledSymbol('charClass', Nonterminal('Class')),
+                            LabeledSymbol('charClass', _NT('Class')),
                             Literal(')')
                         )
                     ),
@@ -840,85 +732,77 @@ char_class = Syntax(
 
 char_range = Syntax(
     name='Range',
-    production=Choice(
-        (
-            (
-                LabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            LabeledSymbol('start', Nonterminal('Char')),
-                            Literal('-'),
-                            LabeledSymbol('end', Nonterminal('Char'))
-                        )
-                    ),
-                    'fromTo'
-                ),
-                LabeledRule(
-                    (),
-                    LabeledSymbol('character', Nonterminal('Char')),
-                    'character'
+    production=Choice.single(
+        LabeledRule(
+            (),
+            Sequence(
+                (
+                    LabeledSymbol('start', _NT('Char')),
+                    Literal('-'),
+                    LabeledSymbol('end', _NT('Char'))
                 )
             ),
+            'fromTo'
+        ),
+        LabeledRule(
+            (),
+            LabeledSymbol('character', _NT('Char')),
+            'character'
         )
     )
 )
 
 char = Lexical(
     name='Char',
-    production=Choice(
-        (
-            (
-                UnlabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('\\'),
-                            CharacterRange((
-                                (ord(' '), ord(' ')),
-                                (ord('"'), ord('"')),
-                                (ord("'"), ord("'")),
-                                (ord('-'), ord('-')),
-                                (ord('<'), ord('<')),
-                                (ord('>'), ord('>')),
-                                (ord('['), ord('[')),
-                                (ord(']'), ord(']')),
-                                (ord('\\'), ord('\\')),
-                                (ord('b'), ord('b')),
-                                (ord('f'), ord('f')),
-                                (ord('n'), ord('n')),
-                                (ord('r'), ord('r')),
-                                (ord('t'), ord('t')),
-                            ))
-                        )
-                    )
-                ),
-                UnlabeledRule(
-                    (),
-                    CharacterClassComplement(
-                        CharacterRange((
-                            (ord(' '), ord(' ')),
-                            (ord('"'), ord('"')),
-                            (ord("'"), ord("'")),
-                            (ord('-'), ord('-')),
-                            (ord('<'), ord('<')),
-                            (ord('>'), ord('>')),
-                            (ord('['), ord('[')),
-                            (ord(']'), ord(']')),
-                            (ord('\\'), ord('\\')),
-                            (ord('b'), ord('b')),
-                            (ord('f'), ord('f')),
-                            (ord('n'), ord('n')),
-                            (ord('r'), ord('r')),
-                            (ord('t'), ord('t')),
-                        ))
-                    )
-                ),
-                UnlabeledRule(
-                    (),
-                    Nonterminal('UnicodeEscape')
+    production=Choice.single(
+        UnlabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('\\'),
+                    _CR((
+                        (ord(' '), ord(' ')),
+                        (ord('"'), ord('"')),
+                        (ord("'"), ord("'")),
+                        (ord('-'), ord('-')),
+                        (ord('<'), ord('<')),
+                        (ord('>'), ord('>')),
+                        (ord('['), ord('[')),
+                        (ord(']'), ord(']')),
+                        (ord('\\'), ord('\\')),
+                        (ord('b'), ord('b')),
+                        (ord('f'), ord('f')),
+                        (ord('n'), ord('n')),
+                        (ord('r'), ord('r')),
+                        (ord('t'), ord('t')),
+                    ))
                 )
-            ),
+            )
+        ),
+        UnlabeledRule(
+            (),
+            CharacterClassComplement(
+                _CR((
+                    (ord(' '), ord(' ')),
+                    (ord('"'), ord('"')),
+                    (ord("'"), ord("'")),
+                    (ord('-'), ord('-')),
+                    (ord('<'), ord('<')),
+                    (ord('>'), ord('>')),
+                    (ord('['), ord('[')),
+                    (ord(']'), ord(']')),
+                    (ord('\\'), ord('\\')),
+                    (ord('b'), ord('b')),
+                    (ord('f'), ord('f')),
+                    (ord('n'), ord('n')),
+                    (ord('r'), ord('r')),
+                    (ord('t'), ord('t')),
+                ))
+            )
+        ),
+        UnlabeledRule(
+            (),
+            _NT('UnicodeEscape')
         )
     )
 )
@@ -931,7 +815,7 @@ sym = Syntax(
                 LabeledRule(
                     (),
                     NotFollow(
-                        symbol=LabeledSymbol('nonterminal', Nonterminal('Nonterminal')),
+                        symbol=LabeledSymbol('nonterminal', _NT('Nonterminal')),
                         constraint=Literal('[')
                     ),
                     'nonterminal'
@@ -941,7 +825,7 @@ sym = Syntax(
                     Sequence(
                         (
                             Literal('&'),
-                            LabeledSymbol('nonterminal', Nonterminal('Nonterminal'))
+                            LabeledSymbol('nonterminal', _NT('Nonterminal'))
                         )
                     ),
                     'parameter'
@@ -951,14 +835,14 @@ sym = Syntax(
                     Sequence(
                         (
                             NotFollow(
-                                symbol=LabeledSymbol('nonterminal', Nonterminal('Nonterminal')),
+                                symbol=LabeledSymbol('nonterminal', _NT('Nonterminal')),
                                 constraint=Literal('[')
                             ),
                             Literal('['),
                             LabeledSymbol(
                                 'parameters',
                                 PlusRepeatWithSeparator(
-                                    symbol=Nonterminal('Sym'),
+                                    symbol=_NT('Sym'),
                                     separator=Literal(',')
                                 )
                             ),
@@ -973,7 +857,7 @@ sym = Syntax(
                         (
                             Literal('start'),
                             Literal('['),
-                            LabeledSymbol('nonterminal', Nonterminal('Nonterminal')),
+                            LabeledSymbol('nonterminal', _NT('Nonterminal')),
                             Literal(']')
                         )
                     ),
@@ -983,32 +867,32 @@ sym = Syntax(
                     (),
                     Sequence(
                         (
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
-                            LabeledSymbol('label', Nonterminal('nonterminalLabel'))
+                            LabeledSymbol('symbol', _NT('Sym')),
+                            LabeledSymbol('label', _NT('nonterminalLabel'))
                         )
                     ),
                     'labeled'
                 ),
                 LabeledRule(
                     (),
-                    LabeledSymbol('charClass', Nonterminal('Class')),
+                    LabeledSymbol('charClass', _NT('Class')),
                     'characterClass'
                 ),
                 LabeledRule(
                     (),
-                    LabeledSymbol('string', Nonterminal('StringConstant')),
+                    LabeledSymbol('string', _NT('StringConstant')),
                     'literal'
                 ),
                 LabeledRule(
                     (),
-                    LabeledSymbol('cistring', Nonterminal('CaseInsensitiveStringConstant')),
+                    LabeledSymbol('cistring', _NT('CaseInsensitiveStringConstant')),
                     'caseInsensitiveLiteral'
                 ),
                 LabeledRule(
                     (),
                     Sequence(
                         (
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
                             Literal('+')
                         )
                     ),
@@ -1018,7 +902,7 @@ sym = Syntax(
                     (),
                     Sequence(
                         (
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
                             Literal('*')
                         )
                     ),
@@ -1029,8 +913,8 @@ sym = Syntax(
                     Sequence(
                         (
                             Literal('{'),
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
-                            LabeledSymbol('sep', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
+                            LabeledSymbol('sep', _NT('Sym')),
                             Literal('}'),
                             Literal('+')
                         )
@@ -1042,8 +926,8 @@ sym = Syntax(
                     Sequence(
                         (
                             Literal('{'),
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
-                            LabeledSymbol('sep', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
+                            LabeledSymbol('sep', _NT('Sym')),
                             Literal('}'),
                             Literal('*')
                         )
@@ -1054,7 +938,7 @@ sym = Syntax(
                     (),
                     Sequence(
                         (
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
                             Literal('?')
                         )
                     ),
@@ -1065,12 +949,12 @@ sym = Syntax(
                     Sequence(
                         (
                             Literal('('),
-                            LabeledSymbol('first', Nonterminal('Sym')),
+                            LabeledSymbol('first', _NT('Sym')),
                             Literal('|'),
                             LabeledSymbol(
                                 'alternatives',
                                 PlusRepeatWithSeparator(
-                                    symbol=Nonterminal('Sym'),
+                                    symbol=_NT('Sym'),
                                     separator=Literal('|')
                                 )
                             ),
@@ -1084,11 +968,11 @@ sym = Syntax(
                     Sequence(
                         (
                             Literal('('),
-                            LabeledSymbol('first', Nonterminal('Sym')),
+                            LabeledSymbol('first', _NT('Sym')),
                             LabeledSymbol(
                                 'sequence',
                                 PlusRepeat(
-                                    Nonterminal('Sym')
+                                    _NT('Sym')
                                 )
                             ),
                             Literal(')')
@@ -1100,19 +984,19 @@ sym = Syntax(
                     (),
                     Sequence(
                         (
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
                             Literal('{'),
                             Optional(
                                 LabeledSymbol(
                                     'minimum',
-                                    Nonterminal('IntegerLiteral')
+                                    _NT('IntegerLiteral')
                                 )
                             ),
                             Literal(':'),
                             Optional(
                                 LabeledSymbol(
                                     'maximum',
-                                    Nonterminal('IntegerLiteral')
+                                    _NT('IntegerLiteral')
                                 )
                             ),
                             Literal('}')
@@ -1125,21 +1009,21 @@ sym = Syntax(
                     Sequence(
                         (
                             Literal('{'),
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
-                            LabeledSymbol('separator', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
+                            LabeledSymbol('separator', _NT('Sym')),
                             Literal('}'),
                             Literal('{'),
                             Optional(
                                 LabeledSymbol(
                                     'minimum',
-                                    Nonterminal('IntegerLiteral')
+                                    _NT('IntegerLiteral')
                                 )
                             ),
                             Literal(':'),
                             Optional(
                                 LabeledSymbol(
                                     'maximum',
-                                    Nonterminal('IntegerLiteral')
+                                    _NT('IntegerLiteral')
                                 )
                             ),
                             Literal('}')
@@ -1161,7 +1045,7 @@ sym = Syntax(
                     (),
                     Sequence(
                         (
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
                             Literal('$')
                         )
                     ),
@@ -1172,7 +1056,7 @@ sym = Syntax(
                     Sequence(
                         (
                             Literal('^'),
-                            LabeledSymbol('symbol', Nonterminal('Sym'))
+                            LabeledSymbol('symbol', _NT('Sym'))
                         )
                     ),
                     'startOfLine'
@@ -1181,9 +1065,9 @@ sym = Syntax(
                     (),
                     Sequence(
                         (
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
                             Literal('!'),
-                            LabeledSymbol('label', Nonterminal('NonterminalLabel'))
+                            LabeledSymbol('label', _NT('NonterminalLabel'))
                         )
                     ),
                     'except'
@@ -1192,72 +1076,60 @@ sym = Syntax(
             (
                 AssociativityGroup(
                     associativity=AssociativityOptions.Assoc,
-                    group=Choice(
-                        (
-                            (
-                                AssociativityGroup(
-                                    associativity=AssociativityOptions.Left,
-                                    group=Choice(
+                    group=Choice.single(
+                        AssociativityGroup(
+                            associativity=AssociativityOptions.Left,
+                            group=Choice.single(
+                                LabeledRule(
+                                    (),
+                                    Sequence(
                                         (
-                                            (
-                                                LabeledRule(
-                                                    (),
-                                                    Sequence(
-                                                        (
-                                                            LabeledSymbol('symbol', Nonterminal('Sym')),
-                                                            Literal('>>'),
-                                                            LabeledSymbol('match', Nonterminal('Sym'))
-                                                        )
-                                                    ),
-                                                    'follow'
-                                                ),
-                                                LabeledRule(
-                                                    (),
-                                                    Sequence(
-                                                        (
-                                                            LabeledSymbol('symbol', Nonterminal('Sym')),
-                                                            Literal('!>>'),
-                                                            LabeledSymbol('match', Nonterminal('Sym'))
-                                                        )
-                                                    ),
-                                                    'notFollow'
-                                                ),
-                                            ),
+                                            LabeledSymbol('symbol', _NT('Sym')),
+                                            Literal('>>'),
+                                            LabeledSymbol('match', _NT('Sym'))
                                         )
-                                    )
+                                    ),
+                                    'follow'
                                 ),
-                                AssociativityGroup(
-                                    associativity=AssociativityOptions.Right,
-                                    group=Choice(
+                                LabeledRule(
+                                    (),
+                                    Sequence(
                                         (
-                                            (
-                                                LabeledRule(
-                                                    (),
-                                                    Sequence(
-                                                        (
-                                                            LabeledSymbol('match', Nonterminal('Sym')),
-                                                            Literal('<<'),
-                                                            LabeledSymbol('symbol', Nonterminal('Sym'))
-                                                        )
-                                                    ),
-                                                    'precede'
-                                                ),
-                                                LabeledRule(
-                                                    (),
-                                                    Sequence(
-                                                        (
-                                                            LabeledSymbol('match', Nonterminal('Sym')),
-                                                            Literal('!<<'),
-                                                            LabeledSymbol('symbol', Nonterminal('Sym'))
-                                                        )
-                                                    ),
-                                                    'notPrecede'
-                                                ),
-                                            ),
+                                            LabeledSymbol('symbol', _NT('Sym')),
+                                            Literal('!>>'),
+                                            LabeledSymbol('match', _NT('Sym'))
                                         )
-                                    )
+                                    ),
+                                    'notFollow'
+                                )
+                            )
+                        ),
+                        AssociativityGroup(
+                            associativity=AssociativityOptions.Right,
+                            group=Choice.single(
+                                LabeledRule(
+                                    (),
+                                    Sequence(
+                                        (
+                                            LabeledSymbol('match', _NT('Sym')),
+                                            Literal('<<'),
+                                            LabeledSymbol('symbol', _NT('Sym'))
+                                        )
+                                    ),
+                                    'precede'
                                 ),
-                            ),
+                                LabeledRule(
+                                    (),
+                                    Sequence(
+                                        (
+                                            LabeledSymbol('match', _NT('Sym')),
+                                            Literal('!<<'),
+                                            LabeledSymbol('symbol', _NT('Sym'))
+                                        )
+                                    ),
+                                    'notPrecede'
+                                )
+                            )
                         )
                     )
                 ),
@@ -1269,9 +1141,9 @@ sym = Syntax(
                     ),
                     Sequence(
                         (
-                            LabeledSymbol('symbol', Nonterminal('Sym')),
+                            LabeledSymbol('symbol', _NT('Sym')),
                             Literal('\\\\'),
-                            LabeledSymbol('match', Nonterminal('Sym'))
+                            LabeledSymbol('match', _NT('Sym'))
                         )
                     ),
                     'unequal'
@@ -1283,82 +1155,74 @@ sym = Syntax(
 
 comment = Lexical(
     name='Comment',
-    production=Choice(
-        (
-            (
-                UnlabeledRule(
-                    (),
-                    Sequence(
-                        (
-                            Literal('/*'),
-                            StarRepeat(
-                                Alternative(
-                                    (
-                                        CharacterClassComplement(
-                                            CharacterRange((
-                                                (ord('*'), ord('*')),
-                                            ))
-                                        ),
-                                        NotFollow(
-                                            symbol=Literal('*'),
-                                            constraint=Literal('/')
-                                        )
-                                    )
+    production=Choice.single(
+        UnlabeledRule(
+            (),
+            Sequence(
+                (
+                    Literal('/*'),
+                    StarRepeat(
+                        Alternative(
+                            (
+                                CharacterClassComplement(
+                                    _CR((
+                                        (ord('*'), ord('*')),
+                                    ))
+                                ),
+                                NotFollow(
+                                    symbol=Literal('*'),
+                                    constraint=Literal('/')
                                 )
-                            ),
-                            Literal('*/')
+                            )
                         )
-                    )
-                ),
-                UnlabeledRule(
-                    (),
-                    Sequence(
-                        (
+                    ),
+                    Literal('*/')
+                )
+            )
+        ),
+        UnlabeledRule(
+            (),
+            Sequence(
+                (
 
-                            Literal('//'),
-                            EndOfLine(
-                                StarRepeat(
-                                    CharacterClassComplement(
-                                        CharacterRange((
-                                            (ord('\n'), ord('\n')),
-                                        ))
-                                    )
-                                )
+                    Literal('//'),
+                    EndOfLine(
+                        StarRepeat(
+                            CharacterClassComplement(
+                                _CR((
+                                    (ord('\n'), ord('\n')),
+                                ))
                             )
                         )
                     )
                 )
-            ),
+            )
         )
     )
 )
 
 layout = Layout(
     name='LAYOUT',
-    production=Choice(
-        (
-            (
-                UnlabeledRule(
-                    (),
-                    Nonterminal('Comment')
-                ),
-                UnlabeledRule(
-                    (),
-                    CharacterRange((
-                        (ord('\u0009'), ord('\u000D')),
-                        (ord('\u0020'), ord('\u0020')),
-                        (ord('\u0085'), ord('\u0085')),
-                        (ord('\u00A0'), ord('\u00A0')),
-                        (ord('\u1680'), ord('\u1680')),
-                        (ord('\u180E'), ord('\u180E')),
-                        (ord('\u2000'), ord('\u200A')),
-                        (ord('\u2028'), ord('\u2029')),
-                        (ord('\u202F'), ord('\u202F')),
-                        (ord('\u205F'), ord('\u205F')),
-                        (ord('\u3000'), ord('\u3000')),
-                    ))
-                )
-            ),
+    production=Choice.single(
+        UnlabeledRule(
+            (),
+            _NT('Comment')
+        ),
+        UnlabeledRule(
+            (),
+            _CR((
+                (ord('\u0009'), ord('\u000D')),
+                (ord('\u0020'), ord('\u0020')),
+                (ord('\u0085'), ord('\u0085')),
+                (ord('\u00A0'), ord('\u00A0')),
+                (ord('\u1680'), ord('\u1680')),
+                (ord('\u180E'), ord('\u180E')),
+                (ord('\u2000'), ord('\u200A')),
+                (ord('\u2028'), ord('\u2029')),
+                (ord('\u202F'), ord('\u202F')),
+                (ord('\u205F'), ord('\u205F')),
+                (ord('\u3000'), ord('\u3000')),
+            ))
         )
     )
 )
@@ -1367,31 +1231,34 @@ grammar = GrammarDefinition(
     language='Rascal',
     layout=layout,
     start='SyntaxDefinitions',
-    rules=[
-        syntax_definitions,
-        syntax_definition,
-        start,
-        octal_literal,
-        hex_literal,
-        decimal_literal,
-        integer_literal,
-        assoc,
-        unicode_escape,
-        name,
-        nonterminal_label,
-        string_character,
-        case_insensitive_string_constant,
-        string_constant,
-        nonterminal,
-        syntax_keywords,
-        tag,
-        tag_string,
-        prod_modifier,
-        prod,
-        char_class,
-        char_range,
-        char,
-        sym,
-        comment
-    ]
+    rules={
+        rule.name: rule
+        for rule in [
+            syntax_definitions,
+            syntax_definition,
+            start,
+            octal_literal,
+            hex_literal,
+            decimal_literal,
+            integer_literal,
+            assoc,
+            unicode_escape,
+            name,
+            nonterminal_label,
+            string_character,
+            case_insensitive_string_constant,
+            string_constant,
+            nonterminal,
+            syntax_keywords,
+            tag,
+            tag_string,
+            prod_modifier,
+            prod,
+            char_class,
+            char_range,
+            char,
+            sym,
+            comment
+        ]
+    }
 )
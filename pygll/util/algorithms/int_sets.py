@@ -9,6 +9,30 @@ import functools
 import typing
 
 
+##############################################################################
+##############################################################################
+# Range normalization
+##############################################################################
+
+
+def normalize_ranges(ranges: typing.Iterable[tuple[int, int]]
+                     ) -> tuple[tuple[int, int], ...]:
+    # Simplify a collection of ranges, such that all
+    # duplicate ranges are removed, and overlapping and
+    # adjacent ranges are merged.
+    # After sorting on the start of the ranges, a range
+    # can only overlap or touch the last merged range,
+    # so a single pass suffices.
+    merged = []
+    for start, stop in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            if stop > merged[-1][1]:
+                merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+    return tuple(merged)
+
+
 ##############################################################################
 ##############################################################################
 # IntSet class
@@ -22,7 +46,7 @@ class IntSet:
                  universe: tuple[int, int]):
         self.__universe = universe
         # Normalize the input ranges
-        self.__content = sorted(self.__union(list(content)))
+        self.__content = list(self.__union(content))
 
     @classmethod
     def empty_set(cls, universe: tuple[int, int]) -> typing.Self:
@@ -80,36 +104,7 @@ class IntSet:
 
     @staticmethod
     def __union(ranges: list[tuple[int, int]]) -> tuple[tuple[int, int], ...]:
-        # Simplify a collection of ranges, such that all
-        # duplicate ranges are removed, and overlapping and
-        # adjacent ranges are merged.
-        n = len(ranges)
-        not_changed = 0
-        while len(ranges) > 1:
-            new_ranges = []
-            start, stop = ranges[0]
-            changed = False
-            for other_start, other_stop in ranges[1:]:
-                are_disjoint = stop < other_start or start > other_stop
-                are_adjacent = (stop + 1 == other_start or
-                                other_stop + 1 == start)
-                if are_disjoint and not are_adjacent:
-                    # Disjoint
-                    new_ranges.append((other_start, other_stop))
-                else:
-                    # Merge ranges
-                    start = min(start, other_start)
-                    stop = max(stop, other_stop)
-                    changed = True
-            new_ranges.append((start, stop))
-            ranges = new_ranges
-            if changed:
-                not_changed = 0
-            else:
-                not_changed += 1
-            if not_changed >= n:
-                break
-        return tuple(ranges)
+        return normalize_ranges(ranges)
 
     def __invert__(self):
         # Compute the complement of an IntSet.
@@ -0,0 +1,78 @@
+try:
+    from pygll_tests.util.parser_test import ParserTestCase
+except ImportError:
+    from .util.parser_test import ParserTestCase
+
+
+from pygll.generator.context_free_grammar import (ContextFreeGrammar,
+                                                  Nonterminal,
+                                                  Terminal)
+
+
+class CharacterClassCheck(ParserTestCase):
+
+    @staticmethod
+    def get_grammar_1():
+        g = ContextFreeGrammar(
+            start=Nonterminal('S'),
+            rules={
+                Nonterminal('S'): (
+                    (Terminal.character_class(((ord('a'), ord('z')),)),
+                     Nonterminal('S')),
+                    (Terminal.character_class(((ord('0'), ord('9')),
+                                               (ord('-'), ord('-')),
+                                               (ord('_'), ord('_')))),),
+                )
+            }
+        )
+        return g, {}
+
+    def test_character_class_success(self):
+        parser = self.build_parser(*self.get_grammar_1())
+        self.assert_parsing_success(parser, '0')
+        self.assert_parsing_success(parser, 'a9')
+        self.assert_parsing_success(parser, 'xyz_')
+        self.assert_parsing_success(parser, 'q-')
+
+    def test_character_class_failure(self):
+        parser = self.build_parser(*self.get_grammar_1())
+        self.assert_parsing_failure(parser, '')
+        self.assert_parsing_failure(parser, 'a')
+        self.assert_parsing_failure(parser, 'A0')
+        self.assert_parsing_failure(parser, '0a')
+        self.assert_parsing_failure(parser, 'a+')
+
+    @staticmethod
+    def get_grammar_2():
+        # Enough ranges to be matched as a single character class
+        g = ContextFreeGrammar(
+            start=Nonterminal('S'),
+            rules={
+                Nonterminal('S'): (
+                    (Terminal.character_class(((ord('a'), ord('c')),
+                                               (ord('x'), ord('z')),
+                                               (ord(']'), ord(']')),
+                                               (ord('\\'), ord('\\')),
+                                               (ord('^'), ord('^')),
+                                               (0x1F600, 0x1F64F))),
+                     Nonterminal('S')),
+                    (Terminal.literal('.'),),
+                )
+            }
+        )
+        return g, {}
+
+    def test_many_ranges_success(self):
+        parser = self.build_parser(*self.get_grammar_2())
+        self.assert_parsing_success(parser, '.')
+        self.assert_parsing_success(parser, 'abz.')
+        self.assert_parsing_success(parser, ']\\^.')
+        self.assert_parsing_success(parser, '\U0001F600.')
+
+    def test_many_ranges_failure(self):
+        parser = self.build_parser(*self.get_grammar_2())
+        self.assert_parsing_failure(parser, '')
+        self.assert_parsing_failure(parser, 'd.')
+        self.assert_parsing_failure(parser, '-.')
+        self.assert_parsing_failure(parser, '[.')
+        self.assert_parsing_failure(parser, '\U0001F650.')
@@ -0,0 +1,22 @@
+try:
+    from pygll_tests import test_character_class, test_follow, test_precede
+    from pygll_tests import test_nullable
+except ImportError:
+    from . import test_character_class, test_follow, test_precede
+    from . import test_nullable
+
+
+class GeneratedCharacterClassCheck(test_character_class.CharacterClassCheck):
+    generate_code = True
+
+
+class GeneratedFollowCheck(test_follow.FollowCheck):
+    generate_code = True
+
+
+class GeneratedNotPrecede(test_precede.TestNotPrecede):
+    generate_code = True
+
+
+class GeneratedNullableCheck(test_nullable.NullableCheck):
+    generate_code = True
@@ -0,0 +1,118 @@
+import unittest
+
+from pygll.generator.context_free_grammar import ContextFreeGrammar, Nonterminal, Terminal
+
+
+class ContextFreeGrammarTest(unittest.TestCase):
+
+    @staticmethod
+    def get_grammar():
+        # S -> A "b" | "c"
+        # A -> "a" | ()
+        return ContextFreeGrammar(
+            start=Nonterminal('S'),
+            rules={
+                Nonterminal('S'): (
+                    (Nonterminal('A'), Terminal.literal('b')),
+                    (Terminal.literal('c'),)
+                ),
+                Nonterminal('A'): (
+                    (Terminal.literal('a'),),
+                    (Terminal.empty(),)
+                )
+            }
+        )
+
+    def test_first(self):
+        grammar = self.get_grammar()
+        self.assertEqual(grammar.first(Nonterminal('A')),
+                         {Terminal.literal('a'), Terminal.empty()})
+        # S is not nullable, even though A is
+        self.assertEqual(grammar.first(Nonterminal('S')),
+                         {Terminal.literal('a'),
+                          Terminal.literal('b'),
+                          Terminal.literal('c')})
+
+    def test_first_nullable_prefix(self):
+        # Epsilon is only in the first sets of nullable nonterminals
+        grammar = self.get_grammar()
+        self.assertNotIn(Terminal.empty(), grammar.first(Nonterminal('S')))
+        self.assertEqual(grammar.nullables, {Nonterminal('A')})
+        # S is not nullable, so its test set does not include follow(S)
+        self.assertEqual(grammar.test(Nonterminal('S')),
+                         {Terminal.literal('a'),
+                          Terminal.literal('b'),
+                          Terminal.literal('c')})
+
+    def test_follow(self):
+        grammar = self.get_grammar()
+        self.assertEqual(grammar.follow(Nonterminal('A')),
+                         {Terminal.literal('b')})
+
+    def test_test(self):
+        grammar = self.get_grammar()
+        self.assertEqual(grammar.test(Nonterminal('A')),
+                         {Terminal.literal('a'),
+                          Terminal.literal('b'),
+                          Terminal.empty()})
+        self.assertEqual(grammar.test_for_sequence(Nonterminal('S'), 0, 0),
+                         {Terminal.literal('a'), Terminal.literal('b')})
+
+    def test_add_rule_invalidates_sets(self):
+        grammar = self.get_grammar()
+        self.assertEqual(grammar.follow(Nonterminal('A')),
+                         {Terminal.literal('b')})
+        grammar.add_rule(Nonterminal('S'),
+                         ((Nonterminal('A'), Terminal.literal('d')),))
+        self.assertEqual(grammar.follow(Nonterminal('A')),
+                         {Terminal.literal('b'), Terminal.literal('d')})
+        self.assertEqual(grammar.test_for_sequence(Nonterminal('S'), 2, 0),
+                         {Terminal.literal('a'), Terminal.literal('d')})
+
+    def test_add_rule_invalidates_sequence_sets(self):
+        grammar = self.get_grammar()
+        self.assertEqual(grammar.first_for_sequence(Nonterminal('S'), 0, 0),
+                         {Terminal.literal('a'), Terminal.literal('b')})
+        grammar.add_rule(Nonterminal('A'), ((Terminal.literal('e'),),))
+        self.assertEqual(grammar.first_for_sequence(Nonterminal('S'), 0, 0),
+                         {Terminal.literal('a'),
+                          Terminal.literal('b'),
+                          Terminal.literal('e')})
+
+    def test_nullables(self):
+        # A and B are nullable through each other; C never is
+        grammar = ContextFreeGrammar(
+            start=Nonterminal('S'),
+            rules={
+                Nonterminal('S'): ((Nonterminal('A'), Nonterminal('B')),
+                                   (Nonterminal('C'),)),
+                Nonterminal('A'): ((Nonterminal('B'), Nonterminal('B')),
+                                   (Terminal.literal('a'),)),
+                Nonterminal('B'): ((Terminal.empty(),),
+                                   (Nonterminal('A'),)),
+                Nonterminal('C'): ((Nonterminal('C'), Terminal.literal('c')),)
+            }
+        )
+        self.assertEqual(grammar.nullables,
+                         {Nonterminal('S'), Nonterminal('A'), Nonterminal('B')})
+
+    def test_reachable_nonterminals(self):
+        grammar = ContextFreeGrammar(
+            start=Nonterminal('S'),
+            rules={
+                Nonterminal('S'): ((Nonterminal('A'),),),
+                Nonterminal('A'): ((Nonterminal('B'), Terminal.literal('a')),),
+                Nonterminal('B'): ((Terminal.literal('b'),),),
+                Nonterminal('C'): ((Nonterminal('S'),),)
+            }
+        )
+        self.assertEqual(grammar.reachable_nonterminals,
+                         {Nonterminal('S'), Nonterminal('A'), Nonterminal('B')})
+
+    def test_rules_view(self):
+        grammar = self.get_grammar()
+        rules = grammar.rules
+        with self.assertRaises(TypeError):
+            rules[Nonterminal('B')] = ((Terminal.literal('b'),),)
+        grammar.add_rule(Nonterminal('B'), ((Terminal.literal('b'),),))
+        self.assertIn(Nonterminal('B'), rules)
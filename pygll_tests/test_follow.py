@@ -223,3 +223,84 @@ class FollowCheck(ParserTestCase):
         parser = self.build_parser(*self.get_grammar_5())
         self.assert_parsing_failure(parser, 'abdedc')
         self.assert_parsing_failure(parser, 'abdebdc')
+
+    ###################################################################
+    ###################################################################
+    # Grammar 6
+    ###################################################################
+
+    @staticmethod
+    def get_grammar_6():
+        g = ContextFreeGrammar(
+            start=Nonterminal('S'),
+            rules={
+                Nonterminal('S'): (
+                    (Terminal.literal('a'), Nonterminal('S')),
+                    (Terminal.literal('b'),),
+                    (Terminal.literal('c'),),
+                    (Terminal.literal('d'),)
+                )
+            }
+        )
+        tags = {
+            (Nonterminal('S'), 0, 0): [
+                ('not_follow', [Terminal.character_class(((ord('b'), ord('c')),))])
+            ]
+        }
+        return g, tags
+
+    def test_character_class_not_follow_success(self):
+        parser = self.build_parser(*self.get_grammar_6())
+        self.assert_parsing_success(parser, 'd')
+        self.assert_parsing_success(parser, 'ad')
+        self.assert_parsing_success(parser, 'aad')
+        self.assert_parsing_success(parser, 'b')
+        self.assert_parsing_success(parser, 'c')
+
+    def test_character_class_not_follow_failure(self):
+        parser = self.build_parser(*self.get_grammar_6())
+        self.assert_parsing_failure(parser, 'ab')
+        self.assert_parsing_failure(parser, 'ac')
+        self.assert_parsing_failure(parser, 'aac')
+
+    ###################################################################
+    ###################################################################
+    # Grammar 7
+    ###################################################################
+
+    @staticmethod
+    def get_grammar_7():
+        g = ContextFreeGrammar(
+            start=Nonterminal('S'),
+            rules={
+                Nonterminal('S'): (
+                    (Nonterminal('A'), Nonterminal('S')),
+                    (Terminal.literal('b'),),
+                    (Terminal.literal('c'),),
+                    (Terminal.literal('d'),)
+                ),
+                Nonterminal('A'): (
+                    (Terminal.literal('a'),),
+                )
+            }
+        )
+        tags = {
+            (Nonterminal('S'), 0, 0): [
+                ('not_follow', [Terminal.character_class(((ord('b'), ord('c')),))])
+            ]
+        }
+        return g, tags
+
+    def test_nonterminal_character_class_not_follow_success(self):
+        parser = self.build_parser(*self.get_grammar_7())
+        self.assert_parsing_success(parser, 'd')
+        self.assert_parsing_success(parser, 'ad')
+        self.assert_parsing_success(parser, 'aad')
+        self.assert_parsing_success(parser, 'b')
+        self.assert_parsing_success(parser, 'c')
+
+    def test_nonterminal_character_class_not_follow_failure(self):
+        parser = self.build_parser(*self.get_grammar_7())
+        self.assert_parsing_failure(parser, 'ab')
+        self.assert_parsing_failure(parser, 'ac')
+        self.assert_parsing_failure(parser, 'aac')
@@ -0,0 +1,83 @@
+import random
+import unittest
+
+from pygll.grammar.grammar_definitions import (CharacterClass,
+                                               CharacterClassComplement,
+                                               CharacterClassDifference,
+                                               CharacterClassIntersection,
+                                               CharacterClassUnion,
+                                               CharacterRange)
+from pygll.util.algorithms.int_sets import IntSet
+
+
+class CharacterClassResolveTest(unittest.TestCase):
+
+    @staticmethod
+    def random_class(rng: random.Random, depth: int):
+        """Return a random character class, together with
+        the IntSet it should resolve to.
+        """
+        universe = CharacterClass.UNICODE_RANGE
+        if depth == 0 or rng.random() < 0.3:
+            ranges = []
+            for _ in range(rng.randint(0, 3)):
+                start = rng.randint(0, 200)
+                ranges.append((start, start + rng.randint(0, 30)))
+            return CharacterRange(tuple(ranges)), IntSet(ranges, universe)
+        kind = rng.randint(0, 3)
+        left, left_set = CharacterClassResolveTest.random_class(rng, depth - 1)
+        if kind == 0:
+            return CharacterClassComplement(left), ~left_set
+        right, right_set = CharacterClassResolveTest.random_class(rng, depth - 1)
+        if kind == 1:
+            return CharacterClassUnion(left, right), left_set | right_set
+        if kind == 2:
+            return CharacterClassIntersection(left, right), left_set & right_set
+        return CharacterClassDifference(left, right), left_set - right_set
+
+    def test_nested_against_int_set(self):
+        rng = random.Random(5)
+        for _ in range(300):
+            cls, expected = self.random_class(rng, 4)
+            self.assertEqual(cls.resolve(), expected.ranges)
+
+    def test_complement(self):
+        cls = CharacterClassComplement(CharacterRange(((0, 9), (20, 29))))
+        self.assertEqual(cls.resolve(),
+                         ((10, 19), (30, CharacterClass.UNICODE_MAX)))
+        everything = CharacterClassComplement(CharacterRange(()))
+        self.assertEqual(everything.resolve(), (CharacterClass.UNICODE_RANGE,))
+        self.assertEqual(CharacterClassComplement(everything).resolve(), ())
+
+    def test_union_merges_adjacent_ranges(self):
+        cls = CharacterClassUnion(CharacterRange(((0, 4), (10, 12))),
+                                  CharacterRange(((5, 8), (11, 20))))
+        self.assertEqual(cls.resolve(), ((0, 8), (10, 20)))
+
+    def test_deep_chain(self):
+        # Deeper than the recursion limit
+        cls = CharacterRange(((0, 0),))
+        for i in range(1, 5000):
+            point = 2 * (i % 50)
+            cls = CharacterClassUnion(cls, CharacterRange(((point, point),)))
+        self.assertEqual(cls.resolve(),
+                         tuple((2 * i, 2 * i) for i in range(50)))
+        complement = CharacterRange(((0, 9),))
+        for _ in range(5001):
+            complement = CharacterClassComplement(complement)
+        self.assertEqual(complement.resolve(),
+                         ((10, CharacterClass.UNICODE_MAX),))
+
+    def test_shared_operand(self):
+        shared = CharacterRange(((ord('a'), ord('z')), (ord('0'), ord('9'))))
+        letters = CharacterRange(((ord('a'), ord('z')),))
+        cls = CharacterClassUnion(
+            CharacterClassDifference(shared, letters),
+            CharacterClassIntersection(shared, letters)
+        )
+        self.assertEqual(cls.resolve(), shared.resolve())
+        self.assertEqual(shared.resolve(),
+                         ((ord('0'), ord('9')), (ord('a'), ord('z'))))
+        everything = CharacterClassUnion(shared,
+                                         CharacterClassComplement(shared))
+        self.assertEqual(everything.resolve(), (CharacterClass.UNICODE_RANGE,))
@@ -0,0 +1,72 @@
+try:
+    from pygll_tests.util.parser_test import ParserTestCase
+except ImportError:
+    from .util.parser_test import ParserTestCase
+
+
+from pygll.generator.context_free_grammar import (ContextFreeGrammar,
+                                                  Nonterminal,
+                                                  Terminal)
+
+
+class NullableCheck(ParserTestCase):
+
+    ###################################################################
+    ###################################################################
+    # Grammar 1
+    ###################################################################
+
+    @staticmethod
+    def get_grammar_1():
+        # S -> A "a"
+        # A -> ()
+        g = ContextFreeGrammar(
+            start=Nonterminal('S'),
+            rules={
+                Nonterminal('S'): (
+                    (Nonterminal('A'), Terminal.literal('a')),
+                ),
+                Nonterminal('A'): (
+                    (),
+                )
+            }
+        )
+        return g, {}
+
+    def test_single_alternative_starting_with_nullable_failure(self):
+        # The selection function of S must still test the input
+        parser = self.build_parser(*self.get_grammar_1())
+        self.assert_parsing_failure(parser, '')
+        self.assert_parsing_failure(parser, 'ba')
+
+    ###################################################################
+    ###################################################################
+    # Grammar 2
+    ###################################################################
+
+    @staticmethod
+    def get_grammar_2():
+        # S -> A "a"
+        # A -> ε
+        g = ContextFreeGrammar(
+            start=Nonterminal('S'),
+            rules={
+                Nonterminal('S'): (
+                    (Nonterminal('A'), Terminal.literal('a')),
+                ),
+                Nonterminal('A'): (
+                    (Terminal.empty(),),
+                )
+            }
+        )
+        return g, {}
+
+    def test_single_alternative_starting_with_epsilon_success(self):
+        parser = self.build_parser(*self.get_grammar_2())
+        self.assert_parsing_success(parser, 'a')
+
+    def test_single_alternative_starting_with_epsilon_failure(self):
+        parser = self.build_parser(*self.get_grammar_2())
+        self.assert_parsing_failure(parser, '')
+        self.assert_parsing_failure(parser, 'ba')
+        self.assert_parsing_failure(parser, 'aa')
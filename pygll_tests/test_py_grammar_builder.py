@@ -0,0 +1,190 @@
+import dataclasses
+import unittest
+
+from pygll.grammar import grammar_definitions as defs
+from pygll.grammar.py_grammar_builder import (assoc, chars, left, lit,
+                                              non_assoc, right, syntax)
+
+
+def structure(x):
+    """Convert a grammar definition into nested tuples,
+    so definitions can be compared structurally.
+    """
+    if dataclasses.is_dataclass(x):
+        return (type(x).__name__,) + tuple(
+            structure(getattr(x, field.name))
+            for field in dataclasses.fields(x)
+            if field.repr
+        )
+    if isinstance(x, tuple):
+        return tuple(structure(y) for y in x)
+    return x
+
+
+def sequence(*items):
+    return structure(defs.Sequence(tuple(items)))
+
+
+def alternative(*alternatives):
+    return structure(defs.Alternative(tuple(alternatives)))
+
+
+A, B, C, D = (defs.Literal(x) for x in 'abcd')
+
+
+class AltBuilderTest(unittest.TestCase):
+
+    def assert_definition(self, builder, expected):
+        self.assertEqual(structure(builder.finalize()), expected)
+
+    def test_chained_sequence(self):
+        self.assert_definition(lit('a') + 'b' + 'c' + 'd',
+                               sequence(A, B, C, D))
+
+    def test_chained_alternative(self):
+        self.assert_definition(lit('a') | 'b' | 'c' | 'd',
+                               alternative(A, B, C, D))
+
+    def test_reverse_operators(self):
+        self.assert_definition('a' + lit('b') + 'c', sequence(A, B, C))
+        self.assert_definition('a' | lit('b') | 'c', alternative(A, B, C))
+
+    def test_shared_prefix(self):
+        # Extending the same builder twice must not let
+        # the extensions see each other.
+        prefix = lit('a') + 'b'
+        first = prefix + 'c'
+        second = prefix + 'd'
+        longer = first + 'd'
+        self.assert_definition(first, sequence(A, B, C))
+        self.assert_definition(second, sequence(A, B, D))
+        self.assert_definition(longer, sequence(A, B, C, D))
+        self.assert_definition(prefix, sequence(A, B))
+
+    def test_shared_prefix_alternative(self):
+        prefix = lit('a') | 'b'
+        first = prefix | 'c'
+        second = prefix | 'd'
+        self.assert_definition(first, alternative(A, B, C))
+        self.assert_definition(second, alternative(A, B, D))
+        self.assert_definition(prefix, alternative(A, B))
+
+    def test_extend_finalized(self):
+        prefix = lit('a') + 'b'
+        prefix.finalize()
+        self.assert_definition(prefix + 'c', sequence(A, B, C))
+        self.assert_definition(prefix, sequence(A, B))
+
+    def test_mixed_operators(self):
+        self.assert_definition(
+            (lit('a') + 'b') | (lit('c') + 'd'),
+            alternative(defs.Sequence((A, B)), defs.Sequence((C, D)))
+        )
+        self.assert_definition(
+            (lit('a') | 'b') + 'c' + 'd',
+            sequence(defs.Alternative((A, B)), C, D)
+        )
+        self.assert_definition(
+            (lit('a') + 'b') | 'c' | 'd',
+            alternative(defs.Sequence((A, B)), C, D)
+        )
+
+    def test_nested_operand_is_not_flattened(self):
+        self.assert_definition(
+            lit('a') + (lit('b') + 'c'),
+            sequence(A, defs.Sequence((B, C)))
+        )
+
+    def test_character_class_operand(self):
+        self.assert_definition(
+            lit('a') + chars(['0', '9']),
+            sequence(A, defs.CharacterRange(((ord('0'), ord('9')),)))
+        )
+
+
+class AssociativityTest(unittest.TestCase):
+
+    def assert_group(self, group, associativity):
+        self.assertIs(group.associativity, associativity)
+        expected = defs.Choice.single(
+            defs.UnlabeledRule((), A),
+            defs.UnlabeledRule((), defs.Sequence((B, C)))
+        )
+        self.assertEqual(structure(group.group), structure(expected))
+
+    def test_assoc(self):
+        self.assert_group(assoc('a', lit('b') + 'c'),
+                          defs.AssociativityOptions.Assoc)
+
+    def test_left(self):
+        self.assert_group(left('a', lit('b') + 'c'),
+                          defs.AssociativityOptions.Left)
+
+    def test_right(self):
+        self.assert_group(right('a', lit('b') + 'c'),
+                          defs.AssociativityOptions.Right)
+
+    def test_non_assoc(self):
+        self.assert_group(non_assoc('a', lit('b') + 'c'),
+                          defs.AssociativityOptions.NonAssoc)
+
+
+class RuleBuilderTest(unittest.TestCase):
+
+    def assert_added(self, operand, expected):
+        rule = builder = syntax('S')
+        rule |= operand
+        self.assertIs(rule, builder)
+        expected = defs.Syntax('S', defs.Choice.single(expected))
+        self.assertEqual(structure(rule.finalize()), structure(expected))
+
+    def test_add_builder(self):
+        self.assert_added(lit('a') + 'b',
+                          defs.UnlabeledRule((), defs.Sequence((A, B))))
+
+    def test_add_reference(self):
+        self.assert_added(syntax('T').ref,
+                          defs.UnlabeledRule((), defs.Nonterminal('T')))
+
+    def test_add_character_class(self):
+        self.assert_added(
+            chars(['a', 'z']),
+            defs.UnlabeledRule((), defs.CharacterRange(((97, 122),)))
+        )
+
+    def test_add_string(self):
+        self.assert_added('a', defs.UnlabeledRule((), A))
+
+    def test_add_literal(self):
+        self.assert_added(defs.Literal('a'), defs.UnlabeledRule((), A))
+
+    def test_add_empty(self):
+        self.assert_added('', defs.UnlabeledRule((), defs.Empty()))
+        self.assert_added(defs.Empty(), defs.UnlabeledRule((), defs.Empty()))
+
+    def test_add_rules(self):
+        unlabeled = defs.UnlabeledRule((), A)
+        self.assert_added(unlabeled, unlabeled)
+        labeled = defs.LabeledRule((), A, 'a')
+        self.assert_added(labeled, labeled)
+
+    def test_add_several(self):
+        rule = syntax('S', 'a')
+        rule |= lit('b') | 'c'
+        rule |= chars(['0', '9'])
+        self.assertEqual(
+            structure(rule.finalize()),
+            structure(defs.Syntax('S', defs.Choice.single(
+                defs.UnlabeledRule((), A),
+                defs.UnlabeledRule((), defs.Alternative((B, C))),
+                defs.UnlabeledRule((), defs.CharacterRange(((48, 57),)))
+            )))
+        )
+
+    def test_unsupported_operand(self):
+        rule = syntax('S')
+        for operand in (1, None, defs.Nonterminal('T')):
+            self.assertIs(rule.__ior__(operand), NotImplemented)
+            with self.assertRaises(TypeError):
+                rule |= operand
+        self.assertEqual(rule.finalize().production.choices, ((),))
@@ -24,17 +24,33 @@ class ParserTestCase(unittest.TestCase):
 
     In particular, this class generates a file for every failed test,
     containing the generated parser.
+
+    By default, parsers are built using the interpreter.
+    Subclasses can set `generate_code` to test the parsers
+    produced by the Python code generator instead.
     """
 
+    generate_code = False
+
     def setUp(self) -> None:
         self.__abstract_parser = None
 
     def build_parser(self, grammar, tags):
         self.__abstract_parser = _gen_abstract_parser('TestParser', grammar, tags)
+        if self.generate_code:
+            return self.__load_generated_parser()
         return build_dynamic_parser(
             self.__abstract_parser
         )
 
+    def __load_generated_parser(self):
+        buffer = io.StringIO()
+        gen = PythonCodeGenerator(buffer)
+        gen.generate_code(self.__abstract_parser)
+        namespace = {}
+        exec(buffer.getvalue(), namespace)
+        return namespace['TestParser']
+
     def tearDown(self):
         self.__abstract_parser = None
 